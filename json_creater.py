@@ -1,15 +1,24 @@
+import argparse
+import ast
 import pandas as pd
+import numpy as np
 import json
 import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pandas.api.types import is_numeric_dtype
+from utils.table_store import read_table, table_exists
+
+# Üniversite detay tablosundan okunan sütunlar
+UNIVERSITY_COLUMNS = ['Üniversite İsmi', 'sehir', 'logo', 'banner', 'üniversite Türü']
 
 def get_university_details(unis_start_path):
     """
     Üniversite detaylarını (şehir, logo, banner, üniversite türü) içeren bir sözlük oluşturur.
     """
     try:
-        # Unis_start Excel dosyasını oku
-        df_unis = pd.read_excel(unis_start_path)
+        # Unis_start tablosunu oku (sadece kullanılan sütunlar)
+        df_unis = read_table(unis_start_path, columns=UNIVERSITY_COLUMNS)
         
         # Üniversite detaylarını içeren sözlük oluştur
         university_details = {}
@@ -48,6 +57,139 @@ def normalize_yop_code(yop_code):
     
     return ""
 
+# Puan türüne göre "Yerlesenlerin_YKS_Net_Ortalamalari" içindeki AYT alanları (JSON adı, sütun adı)
+AYT_AVERAGE_FIELDS = {
+    'SAY': [
+        ("AYT_Matematik", 'AYT Matematik'),
+        ("AYT_Fizik", 'AYT Fizik'),
+        ("AYT_Kimya", 'AYT Kimya'),
+        ("AYT_Biyoloji", 'AYT Biyoloji'),
+    ],
+    'EA': [
+        ("AYT_Turk_Dili_ve_Edebiyati", 'AYT Türk Dili ve Edebiyatı'),
+        ("AYT_Matematik", 'AYT Matematik'),
+        ("AYT_Cografya_1", 'AYT Coğrafya-1'),
+        ("AYT_Tarih_1", 'AYT Tarih-1'),
+    ],
+    'SÖZ': [
+        ("AYT_Turk_Dili_ve_Edebiyati", 'AYT Türk Dili ve Edebiyatı'),
+        ("AYT_Tarih_1", 'AYT Tarih-1'),
+        ("AYT_Tarih_2", 'AYT Tarih-2'),
+        ("AYT_Cografya_1", 'AYT Coğrafya-1'),
+        ("AYT_Cografya_2", 'AYT Coğrafya-2'),
+        ("AYT_Felsefe_Grubu", 'AYT Felsefe Grubu'),
+        ("AYT_Din_Kulturu_ve_Ahlak_Bilgisi", 'AYT Din Kültürü ve Ahlak Bilgisi'),
+    ],
+    'DİL': [
+        ("AYT_Yabanci_Dil_1", 'AYT Yabancı Dil 1'),
+        ("AYT_Yabanci_Dil_2", 'AYT Yabancı Dil 2'),
+        ("AYT_Yabanci_Dil_3", 'AYT Yabancı Dil 3'),
+        ("AYT_Yabanci_Dil_4", 'AYT Yabancı Dil 4'),
+        ("AYT_Yabanci_Dil_5", 'AYT Yabancı Dil 5'),
+    ],
+}
+
+# Python liste gösterimi ['a', 'b', ...] (elemanlarda tırnak ya da kaçış karakteri yok) ve elemanları
+LIST_REPR_PATTERN = r"^\[(?:'[^'\\]*'(?:, '[^'\\]*')*)?\]$"
+LIST_ITEM_PATTERN = r"'([^'\\]*)'"
+
+def column_or_default(df, name, default=np.nan):
+    """
+    Sütunu döndürür; sütun yoksa `default` ile dolu bir seri döndürür.
+    """
+    if name in df.columns:
+        return df[name]
+    return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+def text_or_empty(values):
+    """
+    Değerleri stringe çevirir, boş (NaN) değerleri '' yapar.
+    """
+    return values.astype(object).astype(str).where(values.notna(), '')
+
+def normalize_yop_codes(values):
+    """
+    normalize_yop_code'un sütun üzerinde toplu çalışan hali.
+    """
+    codes = pd.Series('', index=values.index, dtype=object)
+    if is_numeric_dtype(values):
+        numbers = values
+        text = None
+    else:
+        text = values.str.strip()  # String olmayan hücreler NaN olur
+        numbers = pd.to_numeric(values.where(text.isna()), errors='coerce')
+
+    valid = numbers.notna()
+    codes[valid] = np.trunc(numbers[valid].astype(float)).astype('int64').astype(str)
+    if text is not None:
+        codes = text.where(text.notna(), codes)
+    return codes
+
+def clean_counts(values):
+    """
+    Öğretim üyesi sayısı sütununu toplu temizler: sayılar tam sayıya çevrilir, metinlerdeki
+    rakamlar birleştirilir. Sayı çıkarılamayan hücreler NaN kalır.
+    """
+    if is_numeric_dtype(values):
+        return np.trunc(values.astype(float))
+
+    digits = values.str.replace(r'[^0-9]', '', regex=True)  # String olmayan hücreler NaN olur
+    from_text = pd.to_numeric(digits.where(digits != ''), errors='coerce')
+    numbers = pd.to_numeric(values.where(digits.isna()), errors='coerce')
+    return from_text.fillna(np.trunc(numbers.astype(float)))
+
+def parse_list_column(values):
+    """
+    Listeyi metin olarak tutan son4_* sütununu eval kullanmadan listelere çevirir.
+    Tırnaklı basit listeler toplu ayrıştırılır, diğer metinler ast.literal_eval ile denenir.
+    Ayrıştırılamayan hücreler ve zaten liste olan hücreler olduğu gibi bırakılır.
+    """
+    if is_numeric_dtype(values):
+        return values.astype(object)
+
+    text = values.str.strip()  # String olmayan hücreler NaN olur
+    simple = text.str.match(LIST_REPR_PATTERN).fillna(False).astype(bool)
+    parsed = values.astype(object).where(~simple, text.str.findall(LIST_ITEM_PATTERN))
+
+    def literal(value):
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+            return value
+
+    other = text.notna() & ~simple
+    if other.any():
+        parsed[other] = text[other].map(literal)
+    return parsed
+
+def list_item(values, position):
+    """
+    Liste hücrelerinin `position` sıradaki elemanını, yoksa None döndürür.
+    """
+    is_list = values.map(lambda value: isinstance(value, list))
+    items = values.where(is_list).str.get(position)
+    return items.astype(object).where(items.notna(), None)
+
+# Yerleşen son kişinin netlerinde tüm puan türlerinde ortak TYT alanları ve puan türüne göre AYT alanları
+TYT_NET_FIELDS = ['TYT Temel Matematik', 'TYT Fen Bilimleri', 'TYT Türkçe', 'TYT Sosyal Bilimler']
+AYT_NET_FIELDS = {
+    'SAY': ['AYT Matematik', 'AYT Fizik', 'AYT Kimya', 'AYT Biyoloji'],
+    'SÖZ': ['AYT Türk Dili ve Edebiyatı', 'AYT Coğrafya-1', 'AYT Coğrafya-2', 'AYT Tarih-1', 'AYT Tarih-2',
+            'AYT Felsefe Grubu', 'AYT Din Kültürü ve Ahlak Bilgisi'],
+    'EA': ['AYT Türk Dili ve Edebiyatı', 'AYT Matematik', 'AYT Coğrafya-1', 'AYT Tarih-1'],
+    'DİL': ['AYT Yabancı Dil 1'],
+}
+
+# Program tablolarından (*_rj) okunan sütunlar; tabloda olmayanlar atlanır
+PROGRAM_COLUMNS = [
+    'Üniversite İsmi', 'fakülte', 'bolum', 'yop', 'burs', 'type', 'doluluk', 'puan',
+    'son4_kont', 'son4_yerleşen', 'son4_sıralama', 'son4_puan',
+    'Yerleşen son kişinin Diploma notu', 'Ortalama OBP',
+    'TYT Temel Matematik', 'TYT Matematik', 'TYT Fen Bilimleri', 'TYT Fen', 'TYT Türkçe',
+    'TYT Sosyal Bilimler', 'TYT Sosyal',
+    'Profesör', 'Doçent', 'Doktora', 'Toplam Öğretim Görvelisi',
+] + list(dict.fromkeys(column for fields in AYT_AVERAGE_FIELDS.values() for _, column in fields))
+
 def get_net_details():
     """
     Yerleşen son kişilerin net bilgilerini YÖP kodlarına göre içeren bir sözlük oluşturur.
@@ -77,8 +219,9 @@ def get_net_details():
                 
                 for path in [file_name, f"data/{file_name}"]:
                     try:
-                        if os.path.exists(path):
-                            df = pd.read_excel(path)
+                        if table_exists(path):
+                            columns = ['yop', 'type', 'bolum'] + TYT_NET_FIELDS + AYT_NET_FIELDS.get(puan_turu, [])
+                            df = read_table(path, columns=columns)
                             loaded_path = path
                             break
                     except:
@@ -93,74 +236,32 @@ def get_net_details():
                 # Sütun isimlerini kontrol et
                 print(f"{file_name} sütunları: {df.columns.tolist()}")
                 
-                # Her satır için YÖP kodu ve netleri eşleştir
-                yop_count = 0
-                
-                for _, row in df.iterrows():
-                    # YÖP kodunu standartlaştır
-                    yop_code = normalize_yop_code(row.get('yop', ''))
-                    
-                    # Geçerli bir YÖP kodu varsa
-                    if yop_code:
-                        yop_count += 1
-                        
-                        # Puan türüne göre net bilgilerini al
-                        net_dict = {
-                            'type': row.get('type', ''),
-                            'bolum': row.get('bolum', '')
+                # YÖP kodlarını ve net sütunlarını toplu hazırla
+                yop_codes = normalize_yop_codes(column_or_default(df, 'yop', ''))
+                fields = [field for field in TYT_NET_FIELDS + AYT_NET_FIELDS.get(puan_turu, []) if field in df.columns]
+                nets = pd.DataFrame({
+                    'type': column_or_default(df, 'type', ''),
+                    'bolum': column_or_default(df, 'bolum', ''),
+                })
+                for field in fields:
+                    # Virgüllü sayıları noktalı formata çevir
+                    values = df[field]
+                    if not is_numeric_dtype(values):
+                        replaced = values.str.replace(',', '.', regex=False)
+                        values = replaced.where(replaced.notna(), values)
+                    nets[field] = values
+                
+                yop_count = int((yop_codes != '').sum())
+                names = nets.columns.tolist()
+                net_rows = zip(*(nets[name].tolist() for name in names))
+                for yop_code, net_values in zip(yop_codes.tolist(), net_rows):
+                    # Eğer aynı YÖP kodu için önceki kayıtlar varsa, atla
+                    # İlk bulunan kaydı kullan
+                    if yop_code and yop_code not in net_details:
+                        net_details[yop_code] = {
+                            k: v for k, v in zip(names, net_values)
+                            if k in ('type', 'bolum') or (not pd.isna(v) and v != '')
                         }
-                        
-                        # TYT netleri - tüm puan türlerinde ortak
-                        for field in ['TYT Temel Matematik', 'TYT Fen Bilimleri', 'TYT Türkçe', 'TYT Sosyal Bilimler']:
-                            if field in df.columns:
-                                value = row.get(field, '')
-                                if not pd.isna(value) and value != '':
-                                    # Virgüllü sayıları noktalı formata çevir
-                                    if isinstance(value, str) and ',' in value:
-                                        value = value.replace(',', '.')
-                                    net_dict[field] = value
-                        
-                        # Puan türüne göre AYT netleri
-                        if puan_turu == 'SAY':
-                            for field in ['AYT Matematik', 'AYT Fizik', 'AYT Kimya', 'AYT Biyoloji']:
-                                if field in df.columns:
-                                    value = row.get(field, '')
-                                    if not pd.isna(value) and value != '':
-                                        if isinstance(value, str) and ',' in value:
-                                            value = value.replace(',', '.')
-                                        net_dict[field] = value
-                        elif puan_turu == 'SÖZ':
-                            for field in ['AYT Türk Dili ve Edebiyatı', 'AYT Coğrafya-1', 'AYT Coğrafya-2', 
-                                         'AYT Tarih-1', 'AYT Tarih-2', 'AYT Felsefe Grubu', 
-                                         'AYT Din Kültürü ve Ahlak Bilgisi']:
-                                if field in df.columns:
-                                    value = row.get(field, '')
-                                    if not pd.isna(value) and value != '':
-                                        if isinstance(value, str) and ',' in value:
-                                            value = value.replace(',', '.')
-                                        net_dict[field] = value
-                        elif puan_turu == 'EA':
-                            for field in ['AYT Türk Dili ve Edebiyatı', 'AYT Matematik', 
-                                         'AYT Coğrafya-1', 'AYT Tarih-1']:
-                                if field in df.columns:
-                                    value = row.get(field, '')
-                                    if not pd.isna(value) and value != '':
-                                        if isinstance(value, str) and ',' in value:
-                                            value = value.replace(',', '.')
-                                        net_dict[field] = value
-                        elif puan_turu == 'DİL':
-                            for field in ['AYT Yabancı Dil 1']:
-                                if field in df.columns:
-                                    value = row.get(field, '')
-                                    if not pd.isna(value) and value != '':
-                                        if isinstance(value, str) and ',' in value:
-                                            value = value.replace(',', '.')
-                                        net_dict[field] = value
-                        
-                        # Eğer aynı YÖP kodu için önceki kayıtlar varsa, atla
-                        # İlk bulunan kaydı kullan
-                        if yop_code not in net_details:
-                            net_details[yop_code] = net_dict
                 
                 print(f"{file_name} - YÖP kodu bulunan satır sayısı: {yop_count}")
                 total_yop_rows += yop_count
@@ -189,13 +290,68 @@ def get_net_details():
         print(f"Net bilgileri yüklenirken hata oluştu: {e}")
         return {}
 
+def transform_programs(df, puan_turu, net_details):
+    """
+    JSON'a yazılacak türetilmiş sütunları bütün tablo için toplu hesaplar: YÖP kodu,
+    yerleşenlerin net ortalamaları, son 4 yıl listeleri, sıralama yılları ve öğretim üyesi sayıları.
+    """
+    out = pd.DataFrame(index=df.index)
+    out['yop_code'] = normalize_yop_codes(column_or_default(df, 'yop'))
+    out['diploma_notu'] = text_or_empty(column_or_default(df, 'Yerleşen son kişinin Diploma notu', ''))
+    out['ortalama_obp'] = text_or_empty(column_or_default(df, 'Ortalama OBP', ''))
+
+    # TYT verileri için farklı sütun yazımları da denenir
+    out['tyt_mat'] = text_or_empty(column_or_default(df, 'TYT Temel Matematik')
+                                   .fillna(column_or_default(df, 'TYT Matematik', '')))
+    out['tyt_fen'] = text_or_empty(column_or_default(df, 'TYT Fen Bilimleri')
+                                   .fillna(column_or_default(df, 'TYT Fen', '')))
+    out['tyt_turkce'] = text_or_empty(column_or_default(df, 'TYT Türkçe', ''))
+    out['tyt_sosyal'] = text_or_empty(column_or_default(df, 'TYT Sosyal Bilimler')
+                                      .fillna(column_or_default(df, 'TYT Sosyal', '')))
+
+    out['son4_yerlesen'] = parse_list_column(df['son4_yerleşen'])
+    out['son4_siralama'] = parse_list_column(df['son4_sıralama'])
+    out['son4_puan'] = parse_list_column(df['son4_puan'])
+    out['siralama_2024'] = list_item(out['son4_siralama'], 0)
+    out['siralama_2023'] = list_item(out['son4_siralama'], 1)
+    out['siralama_2022'] = list_item(out['son4_siralama'], 2)
+
+    # Öğretim üyesi sayıları; toplam yoksa ya da diğerlerinin toplamından küçükse toplam hesaplanır
+    profesor = clean_counts(column_or_default(df, 'Profesör')).fillna(0).astype('int64')
+    docent = clean_counts(column_or_default(df, 'Doçent')).fillna(0).astype('int64')
+    doktora = clean_counts(column_or_default(df, 'Doktora')).fillna(0).astype('int64')
+    subtotal = profesor + docent + doktora
+    toplam = clean_counts(column_or_default(df, 'Toplam Öğretim Görvelisi')).fillna(subtotal).astype('int64')
+    out['profesor'] = profesor
+    out['docent'] = docent
+    out['doktora'] = doktora
+    out['toplam'] = toplam.where(toplam >= subtotal, subtotal)
+
+    # Puan türü satırdaki 'puan' sütunundan, yoksa dosyanın puan türünden alınır
+    puan = column_or_default(df, 'puan', '')
+    has_puan = puan.notna() & (puan.astype(object) != '')
+    out['puan_turu_value'] = puan.astype(object).astype(str).str.upper().where(has_puan, puan_turu.upper())
+
+    # Yerleşen son kişinin netleri - YÖP koduna göre ('-' ve boş değerler hariç)
+    nets = {}
+    for yop_code in out['yop_code'].unique():
+        if yop_code and yop_code in net_details:
+            nets[yop_code] = {
+                k: v for k, v in net_details[yop_code].items()
+                if k not in ['type', 'bolum'] and not pd.isna(v) and v != '-' and v != ''
+            }
+    out['yop_match'] = out['yop_code'].isin(nets.keys())
+    out['netler'] = out['yop_code'].map(lambda yop_code: nets.get(yop_code, {}))
+    return out
+
 def excel_to_hierarchical_json(excel_file, puan_turu, university_details, net_details):
     """
     Excel dosyasını hiyerarşik JSON'a dönüştürür ve üniversite detaylarını ekler.
+    Türetilmiş sütunlar önce transform_programs ile toplu hesaplanır, sonra iç içe kayıtlar oluşturulur.
     """
     try:
-        # Excel dosyasını oku
-        df = pd.read_excel(excel_file)
+        # Tabloyu oku (Parquet varsa Parquet, sadece kullanılan sütunlar)
+        df = read_table(excel_file, columns=PROGRAM_COLUMNS)
         
         # Sütun isimlerini ve ilk birkaç satırı göster - debug için
         print(f"Sütun isimleri: {df.columns.tolist()}")
@@ -208,292 +364,121 @@ def excel_to_hierarchical_json(excel_file, puan_turu, university_details, net_de
         
         # Üniversite, fakülte ve bölüm bazında sıralama için DataFrame'i düzenle
         df = df.sort_values(by=['Üniversite İsmi', 'fakülte', 'bolum'])
+        derived = transform_programs(df, puan_turu, net_details)
+        
+        # YÖP eşleşme sayacı
+        yop_match_count = int(derived['yop_match'].sum())
+        net_info_count = int((derived['yop_match'] & derived['netler'].astype(bool)).sum())
+        
+        # Debug için - ilk 3 eşleşen YÖP kodu için detayları göster
+        for index in derived.index[derived['yop_match'] & (derived.index < 3)]:
+            yop_code = derived.at[index, 'yop_code']
+            print(f"\nDEBUG - Satır {index}, YÖP: {yop_code}")
+            print(f"  net_details içindeki değer: {net_details[yop_code]}")
+            print(f"  Filtrelenmiş net bilgileri: {derived.at[index, 'netler']}")
+        
+        # Ham olarak yazılan sütunlar
+        raw = pd.DataFrame({
+            'uni_name': df['Üniversite İsmi'],
+            'faculty_name': df['fakülte'],
+            'department_name': df['bolum'],
+            'son4_kont': column_or_default(df, 'son4_kont', ''),
+            'burs': column_or_default(df, 'burs', ''),
+            'type': column_or_default(df, 'type', ''),
+            'doluluk': column_or_default(df, 'doluluk', ''),
+            'puan': column_or_default(df, 'puan', ''),
+        })
+        ayt_columns = {}
+        for fields in AYT_AVERAGE_FIELDS.values():
+            for _, column in fields:
+                ayt_columns[column] = column_or_default(df, column, '')
+        raw = pd.concat([raw, pd.DataFrame(ayt_columns)], axis=1)
         
         # Ana veri yapısı
         universiteler = []
-        
-        # Şu anki işlenen üniversite ve fakülte
         current_uni = None
         current_fakulte = None
         current_uni_dict = None
+        empty_details = {"sehir": "", "logo": "", "banner": "", "universite_Turu": ""}
         
-        # YÖP eşleşme sayacı
-        yop_match_count = 0
-        net_info_count = 0
-        
-        # Veri çerçevesini satır satır işleyelim
-        for index, row in df.iterrows():
-            try:
-                uni_name = row['Üniversite İsmi']
-                faculty_name = row['fakülte']
-                department_name = row['bolum']
-                
-                # YÖP kodunu al ve normalize et
-                yop_code = normalize_yop_code(row.get('yop', ''))
-                
-                # Excel dosyasında sütun adları farklı olabilir
-                diploma_notu = row.get('Yerleşen son kişinin Diploma notu', '')
-                ortalama_obp = row.get('Ortalama OBP', '')
-                
-                # TYT verileri için sütun isimleri kontrol et - farklı yazımlar için de dene
-                tyt_mat = row.get('TYT Temel Matematik', None)
-                if tyt_mat is None or pd.isna(tyt_mat):
-                    tyt_mat = row.get('TYT Matematik', '')
-                
-                tyt_fen = row.get('TYT Fen Bilimleri', None)
-                if tyt_fen is None or pd.isna(tyt_fen):
-                    tyt_fen = row.get('TYT Fen', '')
-                
-                tyt_turkce = row.get('TYT Türkçe', '')
-                tyt_sosyal = row.get('TYT Sosyal Bilimler', None)
-                if tyt_sosyal is None or pd.isna(tyt_sosyal):
-                    tyt_sosyal = row.get('TYT Sosyal', '')
-                
-                # Dizileri doğru şekilde ayrıştır
-                try:
-                    son4_yerlesen = eval(row['son4_yerleşen']) if isinstance(row['son4_yerleşen'], str) else row['son4_yerleşen']
-                except:
-                    son4_yerlesen = row['son4_yerleşen']
-                    
-                try:
-                    son4_siralama = eval(row['son4_sıralama']) if isinstance(row['son4_sıralama'], str) else row['son4_sıralama']
-                except:
-                    son4_siralama = row['son4_sıralama']
-                    
-                try:
-                    son4_puan = eval(row['son4_puan']) if isinstance(row['son4_puan'], str) else row['son4_puan']
-                except:
-                    son4_puan = row['son4_puan']
-                
-                # Öğretim üyesi sayılarını doğru şekilde ele al
-                try:
-                    profesor_val = row.get('Profesör', None)
-                    if pd.isna(profesor_val) or profesor_val == '---' or profesor_val is None:
-                        profesor = 0
-                    elif isinstance(profesor_val, (int, float)) and not pd.isna(profesor_val):
-                        profesor = int(profesor_val)
-                    elif isinstance(profesor_val, str):
-                        # String içindeki sayıyı çıkar
-                        if profesor_val.isdigit():
-                            profesor = int(profesor_val)
-                        else:
-                            # Sayı olmayan karakterleri temizle
-                            cleaned = ''.join(c for c in profesor_val if c.isdigit())
-                            profesor = int(cleaned) if cleaned else 0
-                    else:
-                        profesor = 0
-                except Exception:
-                    profesor = 0
-                
-                # Doçent değerini işle
-                try:
-                    docent_val = row.get('Doçent', None)
-                    if pd.isna(docent_val) or docent_val == '---' or docent_val is None:
-                        docent = 0
-                    elif isinstance(docent_val, (int, float)) and not pd.isna(docent_val):
-                        docent = int(docent_val)
-                    elif isinstance(docent_val, str):
-                        # String içindeki sayıyı çıkar
-                        if docent_val.isdigit():
-                            docent = int(docent_val)
-                        else:
-                            # Sayı olmayan karakterleri temizle
-                            cleaned = ''.join(c for c in docent_val if c.isdigit())
-                            docent = int(cleaned) if cleaned else 0
-                    else:
-                        docent = 0
-                except Exception:
-                    docent = 0
-                
-                # Doktora değerini işle
-                try:
-                    doktora_val = row.get('Doktora', None)
-                    if pd.isna(doktora_val) or doktora_val == '---' or doktora_val is None:
-                        doktora = 0
-                    elif isinstance(doktora_val, (int, float)) and not pd.isna(doktora_val):
-                        doktora = int(doktora_val)
-                    elif isinstance(doktora_val, str):
-                        # String içindeki sayıyı çıkar
-                        if doktora_val.isdigit():
-                            doktora = int(doktora_val)
-                        else:
-                            # Sayı olmayan karakterleri temizle
-                            cleaned = ''.join(c for c in doktora_val if c.isdigit())
-                            doktora = int(cleaned) if cleaned else 0
-                    else:
-                        doktora = 0
-                except Exception:
-                    doktora = 0
-                
-                # Toplam değerini işle
-                try:
-                    toplam_val = row.get('Toplam Öğretim Görvelisi', None)
-                    if pd.isna(toplam_val) or toplam_val == '---' or toplam_val is None:
-                        toplam = profesor + docent + doktora  # Diğerlerinin toplamını kullan
-                    elif isinstance(toplam_val, (int, float)) and not pd.isna(toplam_val):
-                        toplam = int(toplam_val)
-                    elif isinstance(toplam_val, str):
-                        # String içindeki sayıyı çıkar
-                        if toplam_val.isdigit():
-                            toplam = int(toplam_val)
-                        else:
-                            # Sayı olmayan karakterleri temizle
-                            cleaned = ''.join(c for c in toplam_val if c.isdigit())
-                            if cleaned:
-                                toplam = int(cleaned)
-                            else:
-                                toplam = profesor + docent + doktora  # Temiz bir sayı yoksa diğerlerinin toplamını kullan
-                    else:
-                        toplam = profesor + docent + doktora  # Veri tipi bilinmiyorsa diğerlerinin toplamını kullan
-                except Exception:
-                    toplam = profesor + docent + doktora
-                
-                # Eğer toplam için geçerli bir değer yoksa veya diğerlerinin toplamından küçükse, toplam değerini hesapla
-                if toplam < profesor + docent + doktora:
-                    toplam = profesor + docent + doktora
-                
-                # Yerleşenlerin YKS net ortalamaları
-                yerlesenlerin_yks_net_ortalamalari = {
-                    "TYT_Temel_Matematik": str(tyt_mat) if not pd.isna(tyt_mat) else '',
-                    "TYT_Fen_Bilimleri": str(tyt_fen) if not pd.isna(tyt_fen) else '',
-                    "TYT_Turkce": str(tyt_turkce) if not pd.isna(tyt_turkce) else '',
-                    "TYT_Sosyal_Bilimler": str(tyt_sosyal) if not pd.isna(tyt_sosyal) else ''
-                }
-                
-                # Puan türüne göre AYT alanlarını ekle
-                puan_turu_value = row.get('puan', '').upper() if row.get('puan') else puan_turu.upper()
-                
-                if puan_turu_value == 'SAY':
-                    yerlesenlerin_yks_net_ortalamalari.update({
-                        "AYT_Matematik": row.get('AYT Matematik', ''),
-                        "AYT_Fizik": row.get('AYT Fizik', ''),
-                        "AYT_Kimya": row.get('AYT Kimya', ''),
-                        "AYT_Biyoloji": row.get('AYT Biyoloji', '')
-                    })
-                elif puan_turu_value == 'EA':
-                    yerlesenlerin_yks_net_ortalamalari.update({
-                        "AYT_Turk_Dili_ve_Edebiyati": row.get('AYT Türk Dili ve Edebiyatı', ''),
-                        "AYT_Matematik": row.get('AYT Matematik', ''),
-                        "AYT_Cografya_1": row.get('AYT Coğrafya-1', ''),
-                        "AYT_Tarih_1": row.get('AYT Tarih-1', '')
-                    })
-                elif puan_turu_value == 'SÖZ':
-                    yerlesenlerin_yks_net_ortalamalari.update({
-                        "AYT_Turk_Dili_ve_Edebiyati": row.get('AYT Türk Dili ve Edebiyatı', ''),
-                        "AYT_Tarih_1": row.get('AYT Tarih-1', ''),
-                        "AYT_Tarih_2": row.get('AYT Tarih-2', ''),
-                        "AYT_Cografya_1": row.get('AYT Coğrafya-1', ''),
-                        "AYT_Cografya_2": row.get('AYT Coğrafya-2', ''),
-                        "AYT_Felsefe_Grubu": row.get('AYT Felsefe Grubu', ''),
-                        "AYT_Din_Kulturu_ve_Ahlak_Bilgisi": row.get('AYT Din Kültürü ve Ahlak Bilgisi', '')
-                    })
-                elif puan_turu_value == 'DİL':
-                    yerlesenlerin_yks_net_ortalamalari.update({
-                        "AYT_Yabanci_Dil_1": row.get('AYT Yabancı Dil 1', ''),
-                        "AYT_Yabanci_Dil_2": row.get('AYT Yabancı Dil 2', ''),
-                        "AYT_Yabanci_Dil_3": row.get('AYT Yabancı Dil 3', ''),
-                        "AYT_Yabanci_Dil_4": row.get('AYT Yabancı Dil 4', ''),
-                        "AYT_Yabanci_Dil_5": row.get('AYT Yabancı Dil 5', '')
-                    })
-                
-                # Yerleşen son kişinin netleri - YÖP koduna göre alıyoruz
-                yerlesen_son_kisinin_netleri = {}
-                
-                # YÖP kodu eşleşmesi kontrolü
-                if yop_code and yop_code in net_details:
-                    yop_match_count += 1
-                    
-                    # Type ve bolum dışındaki tüm alanları al, '-' değerleri filtrele
-                    net_bilgileri = {}
-                    for k, v in net_details[yop_code].items():
-                        if k not in ['type', 'bolum'] and not pd.isna(v) and v != '-' and v != '':
-                            net_bilgileri[k] = v
-                    
-                    if net_bilgileri:
-                        yerlesen_son_kisinin_netleri = net_bilgileri
-                        net_info_count += 1
-                
-                # Debug için - ilk 3 eşleşen YÖP kodu için detayları göster
-                if index < 3 and yop_code in net_details:
-                    print(f"\nDEBUG - Satır {index}, YÖP: {yop_code}")
-                    print(f"  net_details içindeki değer: {net_details[yop_code]}")
-                    print(f"  Filtrelenmiş net bilgileri: {yerlesen_son_kisinin_netleri}")
-                
-                # Bölüm detayları
-                bolum_detaylari = {
-                    "son_4_yil_toplam_kontenjan": row.get('son4_kont', ''),
-                    "son_4_yil_yerlesen": son4_yerlesen,
-                    "son_4_yil_siralama": son4_siralama,
-                    "son_4_yil_puan": son4_puan,
-                    "YOP_Kodu": yop_code,
-                    "Yerlesen_son_kisinin_Diploma_notu": str(diploma_notu) if not pd.isna(diploma_notu) else '',
-                    "Ortalama_OBP": str(ortalama_obp) if not pd.isna(ortalama_obp) else '',
-                    "Yerlesen_son_kisinin_netleri": yerlesen_son_kisinin_netleri,
-                    "Yerlesenlerin_YKS_Net_Ortalamalari": yerlesenlerin_yks_net_ortalamalari,
-                    "Ogretim_Uyesi_Sayisi_ve_Unvan_Dagilimi": {
-                        "Profesor": profesor,
-                        "Docent": docent,
-                        "Doktora": doktora,
-                        "Toplam_Ogretim_Gorevlisi": toplam
-                    }
+        # Satırlar sütun listelerinden (Python değerleri) okunur
+        raw_names = raw.columns.tolist()
+        derived_names = derived.columns.tolist()
+        raw_rows = zip(*(raw[column].tolist() for column in raw_names))
+        derived_rows = zip(*(derived[column].tolist() for column in derived_names))
+        for raw_values, derived_values in zip(raw_rows, derived_rows):
+            row = dict(zip(raw_names, raw_values))
+            values = dict(zip(derived_names, derived_values))
+            # Yerleşenlerin YKS net ortalamaları
+            yerlesenlerin_yks_net_ortalamalari = {
+                "TYT_Temel_Matematik": values['tyt_mat'],
+                "TYT_Fen_Bilimleri": values['tyt_fen'],
+                "TYT_Turkce": values['tyt_turkce'],
+                "TYT_Sosyal_Bilimler": values['tyt_sosyal'],
+            }
+            for field, column in AYT_AVERAGE_FIELDS.get(values['puan_turu_value'], []):
+                yerlesenlerin_yks_net_ortalamalari[field] = row[column]
+            
+            # Bölüm detayları
+            bolum_detaylari = {
+                "son_4_yil_toplam_kontenjan": row['son4_kont'],
+                "son_4_yil_yerlesen": values['son4_yerlesen'],
+                "son_4_yil_siralama": values['son4_siralama'],
+                "son_4_yil_puan": values['son4_puan'],
+                "YOP_Kodu": values['yop_code'],
+                "Yerlesen_son_kisinin_Diploma_notu": values['diploma_notu'],
+                "Ortalama_OBP": values['ortalama_obp'],
+                "Yerlesen_son_kisinin_netleri": values['netler'],
+                "Yerlesenlerin_YKS_Net_Ortalamalari": yerlesenlerin_yks_net_ortalamalari,
+                "Ogretim_Uyesi_Sayisi_ve_Unvan_Dagilimi": {
+                    "Profesor": values['profesor'],
+                    "Docent": values['docent'],
+                    "Doktora": values['doktora'],
+                    "Toplam_Ogretim_Gorevlisi": values['toplam']
                 }
-                
-                # Bölüm bilgileri
-                siralama_2024 = son4_siralama[0] if isinstance(son4_siralama, list) and len(son4_siralama) > 0 else None
-                siralama_2023 = son4_siralama[1] if isinstance(son4_siralama, list) and len(son4_siralama) > 1 else None
-                siralama_2022 = son4_siralama[2] if isinstance(son4_siralama, list) and len(son4_siralama) > 2 else None
-                
-                bolum = {
-                    "bolum_ismi": department_name,
-                    "siralama_2024": siralama_2024,
-                    "siralama_2023": siralama_2023,
-                    "siralama_2022": siralama_2022,
-                    "bursluluk_durumu": row.get('burs', ''),
-                    "ogrenim_turu": row.get('type', ''),
-                    "doluluk": row.get('doluluk', ''),
-                    "puan_turu": row.get('puan', ''),
-                    "bolum_detaylari": bolum_detaylari
+            }
+            
+            # Bölüm bilgileri
+            bolum = {
+                "bolum_ismi": row['department_name'],
+                "siralama_2024": values['siralama_2024'],
+                "siralama_2023": values['siralama_2023'],
+                "siralama_2022": values['siralama_2022'],
+                "bursluluk_durumu": row['burs'],
+                "ogrenim_turu": row['type'],
+                "doluluk": row['doluluk'],
+                "puan_turu": row['puan'],
+                "bolum_detaylari": bolum_detaylari
+            }
+            
+            # Yeni üniversite ise yeni ekle
+            uni_name = row['uni_name']
+            if current_uni != uni_name:
+                if current_uni_dict:
+                    universiteler.append(current_uni_dict)
+                
+                uni_details = university_details.get(uni_name, empty_details)
+                current_uni = uni_name
+                current_uni_dict = {
+                    "Universite_Ismi": uni_name,
+                    "sehir": uni_details["sehir"],
+                    "logo": uni_details["logo"],
+                    "banner": uni_details["banner"],
+                    "universite_Turu": uni_details["universite_Turu"],
+                    "fakulteler": []
                 }
-                
-                # Üniversite detaylarını al
-                uni_details = university_details.get(uni_name, {
-                    "sehir": "",
-                    "logo": "",
-                    "banner": "",
-                    "universite_Turu": ""
+                current_fakulte = None
+            
+            # Yeni fakülte ise yeni ekle
+            if current_fakulte != row['faculty_name']:
+                current_fakulte = row['faculty_name']
+                current_uni_dict["fakulteler"].append({
+                    "fakulte_ismi": current_fakulte,
+                    "bolumler": []
                 })
-                
-                # Yeni üniversite ise yeni ekle
-                if current_uni != uni_name:
-                    if current_uni_dict:
-                        universiteler.append(current_uni_dict)
-                    
-                    current_uni = uni_name
-                    current_uni_dict = {
-                        "Universite_Ismi": uni_name,
-                        "sehir": uni_details["sehir"],
-                        "logo": uni_details["logo"],
-                        "banner": uni_details["banner"],
-                        "universite_Turu": uni_details["universite_Turu"],
-                        "fakulteler": []
-                    }
-                    current_fakulte = None
-                
-                # Yeni fakülte ise yeni ekle
-                if current_fakulte != faculty_name:
-                    current_fakulte = faculty_name
-                    current_fakulte_dict = {
-                        "fakulte_ismi": faculty_name,
-                        "bolumler": []
-                    }
-                    current_uni_dict["fakulteler"].append(current_fakulte_dict)
-                
-                # Bölümü fakülteye ekle
-                current_uni_dict["fakulteler"][-1]["bolumler"].append(bolum)
-                
-            except Exception as e:
-                print(f"Satır işlenirken hata oluştu (satır {index}): {e}")
-                continue
+            
+            # Bölümü fakülteye ekle
+            current_uni_dict["fakulteler"][-1]["bolumler"].append(bolum)
         
         # Son üniversiteyi de ekle
         if current_uni_dict:
@@ -533,9 +518,70 @@ def save_json(data, output_file):
         print(f"JSON dosyası kaydedilirken hata oluştu: {e}")
         return False
 
-def create_json_files():
+# Puan türü başına süreç sayısı (en fazla puan türü sayısı kadar süreç kullanılır)
+JSON_WORKERS = max(1, min(5, os.cpu_count() or 1))
+
+# Alt süreçlerde ortak sözlükler; süreç başlarken bir kez yüklenir (bkz. init_worker)
+_worker_lookups = {}
+
+def process_score_type(puan_turu, excel_file, university_details, net_details, final_dir="json"):
+    """
+    Tek bir puan türünün tablosunu JSON'a dönüştürüp kaydeder.
+    (işlenen bölüm sayısı, YÖP eşleşme sayısı, net bilgisi sayısı) döndürür.
+    """
+    try:
+        print(f"\n{puan_turu.upper()} puan türü işleniyor... ({excel_file})")
+        
+        # Dosyanın var olup olmadığını kontrol et
+        if not table_exists(excel_file):
+            print(f"UYARI: {excel_file} dosyası bulunamadı. Bu puan türü atlanıyor.")
+            return 0, 0, 0
+            
+        # Dönüşümü gerçekleştir
+        json_data, yop_match_count, net_info_count = excel_to_hierarchical_json(excel_file, puan_turu, university_details, net_details)
+        
+        processed = 0
+        if isinstance(json_data, dict) and "Universiteler" in json_data:
+            processed = sum(
+                sum(len(fakulte["bolumler"]) for fakulte in uni["fakulteler"])
+                for uni in json_data["Universiteler"]
+            )
+        
+        # JSON dosyasının çıktı yolu
+        output_file = f"{final_dir}/{puan_turu}.json"
+        
+        # JSON'ı kaydet
+        if save_json(json_data, output_file):
+            print(f"Dönüşüm tamamlandı. Hiyerarşik JSON dosyası: {output_file}")
+            print(f"  Bu puan türünde {net_info_count} bölüme yerleşen son kişinin net bilgisi eklendi.")
+            print(f"  Toplam {yop_match_count} YÖP kodu eşleşmesi bulundu.")
+        else:
+            print(f"HATA: {output_file} dosyası kaydedilemedi.")
+        return processed, yop_match_count, net_info_count
+            
+    except Exception as e:
+        print(f"HATA: {excel_file} dosyası işlenirken bir sorun oluştu: {e}")
+        return 0, 0, 0
+
+def init_worker(university_details, net_details):
+    """
+    Süreç havuzu başlatıcısı: ortak sözlükleri her alt süreçte bir kez saklar,
+    böylece her görevde tekrar gönderilmezler.
+    """
+    _worker_lookups["university_details"] = university_details
+    _worker_lookups["net_details"] = net_details
+
+def process_score_type_worker(puan_turu, excel_file, final_dir):
+    """
+    Alt süreçte process_score_type'ı init_worker ile yüklenen sözlüklerle çalıştırır.
+    """
+    return process_score_type(puan_turu, excel_file, _worker_lookups["university_details"],
+                              _worker_lookups["net_details"], final_dir)
+
+def create_json_files(workers=1):
     """
     Tüm Excel dosyalarını işleyerek JSON dosyalarını sıfırdan oluşturur.
+    `workers` 1'den büyükse puan türleri süreç havuzunda paralel işlenir.
     """
     print("JSON dosyaları sıfırdan oluşturuluyor...")
     
@@ -581,7 +627,7 @@ def create_json_files():
         
         file_found = False
         for alt_path in alt_paths:
-            if os.path.exists(alt_path):
+            if table_exists(alt_path):
                 excel_files[puan_turu] = alt_path
                 print(f"{puan_turu.upper()} için '{alt_path}' kullanılacak.")
                 file_found = True
@@ -612,41 +658,29 @@ def create_json_files():
     total_processed = 0
     
     # Her dosya için dönüşümü gerçekleştir
-    for puan_turu, excel_file in excel_files.items():
-        try:
-            print(f"\n{puan_turu.upper()} puan türü işleniyor... ({excel_file})")
-            
-            # Dosyanın var olup olmadığını kontrol et
-            if not os.path.exists(excel_file):
-                print(f"UYARI: {excel_file} dosyası bulunamadı. Bu puan türü atlanıyor.")
-                continue
-                
-            # Dönüşümü gerçekleştir
-            json_data, yop_match_count, net_info_count = excel_to_hierarchical_json(excel_file, puan_turu, university_details, net_details)
-            
-            # İstatistikleri güncelle
-            total_matches += yop_match_count
-            total_net_info += net_info_count
-            
-            if isinstance(json_data, dict) and "Universiteler" in json_data:
-                total_processed += sum(
-                    sum(len(fakulte["bolumler"]) for fakulte in uni["fakulteler"])
-                    for uni in json_data["Universiteler"]
-                )
-            
-            # JSON dosyasının çıktı yolu
-            output_file = f"{final_dir}/{puan_turu}.json"
-            
-            # JSON'ı kaydet
-            if save_json(json_data, output_file):
-                print(f"Dönüşüm tamamlandı. Hiyerarşik JSON dosyası: {output_file}")
-                print(f"  Bu puan türünde {net_info_count} bölüme yerleşen son kişinin net bilgisi eklendi.")
-                print(f"  Toplam {yop_match_count} YÖP kodu eşleşmesi bulundu.")
-            else:
-                print(f"HATA: {output_file} dosyası kaydedilemedi.")
-                
-        except Exception as e:
-            print(f"HATA: {excel_file} dosyası işlenirken bir sorun oluştu: {e}")
+    if workers > 1:
+        # Ortak sözlükler her sürece başlatıcı ile bir kez gönderilir
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(excel_files)),
+            initializer=init_worker,
+            initargs=(university_details, net_details),
+        ) as executor:
+            futures = [
+                executor.submit(process_score_type_worker, puan_turu, excel_file, final_dir)
+                for puan_turu, excel_file in excel_files.items()
+            ]
+            results = [future.result() for future in as_completed(futures)]
+    else:
+        results = [
+            process_score_type(puan_turu, excel_file, university_details, net_details, final_dir)
+            for puan_turu, excel_file in excel_files.items()
+        ]
+    
+    # Puan türü istatistiklerini topla
+    for processed, yop_match_count, net_info_count in results:
+        total_processed += processed
+        total_matches += yop_match_count
+        total_net_info += net_info_count
     
     print(f"\nGenel İstatistikler:")
     print(f"  Toplam işlenen bölüm sayısı: {total_processed}")
@@ -654,6 +688,11 @@ def create_json_files():
     print(f"  Toplam net bilgisi eklenen bölüm sayısı: {total_net_info}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tablolardan puan türü başına hiyerarşik JSON dosyaları oluşturur.")
+    parser.add_argument("--workers", type=int, default=JSON_WORKERS,
+                        help="Puan türlerini paralel işleyen süreç sayısı (1: sırayla)")
+    args = parser.parse_args()
+    
     # Sıfırdan JSON dosyaları oluştur
-    create_json_files()
-    print("\nTüm işlemler tamamlandı.")
\ No newline at end of file
+    create_json_files(args.workers)
+    print("\nTüm işlemler tamamlandı.")
@@ -0,0 +1,264 @@
+import re
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+WAIT_TIMEOUT = 30  # Bekleme üst sınırı (saniye)
+POLL_FREQUENCY = 0.1  # Tablo durumunun kontrol sıklığı (saniye)
+
+# draw.dt olaylarını sayan dinleyiciyi sayfaya bir kez ekler
+_INSTALL_DRAW_COUNTER = """
+var table = arguments[0] || 'mydata';
+window.__drawCounts = window.__drawCounts || {};
+if (window.jQuery && !window.__drawCounts.hasOwnProperty(table)) {
+    window.__drawCounts[table] = 0;
+    jQuery('#' + table).on('draw.dt', function () { window.__drawCounts[table] += 1; });
+}
+"""
+
+# Tablonun anlık durumu: çizim sayısı, ilk satırın parmak izi ve işleniyor göstergesi
+_TABLE_STATE = """
+var table = arguments[0] || 'mydata';
+var element = document.getElementById(table);
+if (!element) { return null; }
+var processing = document.getElementById(table + '_processing');
+var busy = !!processing && processing.offsetParent !== null
+    && window.getComputedStyle(processing).display !== 'none';
+var rows = element.querySelectorAll('tbody tr');
+var info = document.getElementById(table + '_info');
+return {
+    draws: (window.__drawCounts && window.__drawCounts[table]) || 0,
+    first: rows.length ? rows[0].innerText : '',
+    rows: rows.length,
+    info: info ? info.innerText : '',
+    busy: busy
+};
+"""
+
+
+def table_state(driver, table="mydata"):
+    """
+    Tablonun anlık durumunu döndürür; tablo yoksa None.
+    """
+    return driver.execute_script(_TABLE_STATE, table)
+
+
+def wait_for_table(driver, table="mydata", timeout=WAIT_TIMEOUT):
+    """
+    Tablo satırları çizilip işleniyor göstergesi kaybolana kadar bekler.
+    Tablo hazır olduğu anda döner, `timeout` sadece üst sınırdır.
+    """
+    def ready(driver):
+        state = table_state(driver, table)
+        if state and state["rows"] > 0 and not state["busy"]:
+            return state
+        return False
+
+    state = WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(ready)
+    driver.execute_script(_INSTALL_DRAW_COUNTER, table)
+    return state
+
+
+def wait_for_redraw(driver, before, table="mydata", timeout=WAIT_TIMEOUT):
+    """
+    Tablonun `before` durumundan sonra yeniden çizilmesini bekler. Yeni bir draw.dt olayı
+    ya da değişen ilk satır/bilgi metni görüldüğünde ve işleniyor göstergesi kapalıyken döner.
+    """
+    def redrawn(driver):
+        state = table_state(driver, table)
+        if not state or state["busy"]:
+            return False
+        if state["draws"] > before["draws"] or state["first"] != before["first"] or state["info"] != before["info"]:
+            return state
+        return False
+
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(redrawn)
+
+
+def next_page_disabled(driver, table="mydata"):
+    """
+    Sonraki sayfa düğmesinin devre dışı olup olmadığını döndürür.
+    """
+    buttons = driver.find_elements(By.CSS_SELECTOR, f'#{table}_next')
+    return not buttons or 'disabled' in (buttons[0].get_attribute('class') or '')
+
+
+def click_next_page(driver, table="mydata", timeout=WAIT_TIMEOUT):
+    """
+    Sonraki sayfaya geçer ve tablo yeniden çizilene kadar bekler.
+    Sonraki sayfa yoksa False döner.
+    """
+    if next_page_disabled(driver, table):
+        return False
+
+    before = table_state(driver, table)
+    links = driver.find_elements(By.CSS_SELECTOR, f'#{table}_next a')
+    (links[0] if links else driver.find_element(By.CSS_SELECTOR, f'#{table}_next')).click()
+    try:
+        wait_for_redraw(driver, before, table, timeout)
+    except TimeoutException:
+        raise TimeoutException(f"#{table} tablosu {timeout} saniye içinde yeniden çizilmedi.")
+    return True
+
+
+# DataTables API ile sayfa bilgisini okur
+_PAGE_INFO = """
+var table = arguments[0] || 'mydata';
+if (!window.jQuery || !jQuery.fn.dataTable || !jQuery.fn.dataTable.isDataTable('#' + table)) { return null; }
+return jQuery('#' + table).DataTable().page.info();
+"""
+
+# DataTables API ile sayfa uzunluğunu değiştirip tabloyu yeniden çizer
+_SET_PAGE_LENGTH = """
+var table = arguments[0] || 'mydata';
+var length = arguments[1];
+if (!window.jQuery || !jQuery.fn.dataTable || !jQuery.fn.dataTable.isDataTable('#' + table)) { return false; }
+jQuery('#' + table).DataTable().page.len(length).draw();
+return true;
+"""
+
+PAGE_LENGTHS = (-1, 10000, 5000, 1000, 500, 100)  # Denenecek sayfa uzunlukları (-1: tüm satırlar)
+
+
+def page_info(driver, table="mydata"):
+    """
+    DataTables `page.info()` çıktısını döndürür (page, pages, start, end, length,
+    recordsTotal, recordsDisplay). API yoksa None.
+    """
+    return driver.execute_script(_PAGE_INFO, table)
+
+
+def set_page_length(driver, length, table="mydata", timeout=WAIT_TIMEOUT):
+    """
+    Sayfa uzunluğunu değiştirir ve yeniden çizimi bekler. Çizilen satır sayısını döndürür;
+    API yoksa ya da tablo yeniden çizilmezse None.
+    """
+    before = table_state(driver, table)
+    if not driver.execute_script(_SET_PAGE_LENGTH, table, length):
+        return None
+    try:
+        state = wait_for_redraw(driver, before, table, timeout)
+    except TimeoutException:
+        return None
+    return state["rows"]
+
+
+def maximize_page_length(driver, table="mydata", lengths=PAGE_LENGTHS, timeout=WAIT_TIMEOUT):
+    """
+    Tablonun kabul ettiği en büyük sayfa uzunluğunu ayarlar ve `page.info()` döndürür.
+    Sunucu uzunluğu sınırlıyorsa sayfa uzunluğu gerçekten dönen satır sayısına
+    indirilir, böylece normal sayfalama bu uzunlukla devam eder. API yoksa None döner.
+    """
+    info = page_info(driver, table)
+    if info is None:
+        return None
+
+    total = info["recordsDisplay"]
+    if info["length"] == -1 or info["length"] >= total:
+        return info
+
+    for length in lengths:
+        if length != -1 and length <= info["length"]:
+            break
+
+        drawn = set_page_length(driver, length, table, timeout)
+        if drawn is None:
+            continue
+
+        expected = total if length == -1 else min(length, total)
+        if drawn >= expected:
+            return page_info(driver, table)
+
+        # Sunucu uzunluğu sınırladı: sınır kadar uzunlukla sayfalamaya devam et
+        if 0 < drawn < expected and drawn > info["length"]:
+            set_page_length(driver, drawn, table, timeout)
+            return page_info(driver, table)
+
+    return page_info(driver, table)
+
+
+def expected_records(driver, table="mydata"):
+    """
+    Tablonun toplam kayıt sayısını DataTables API'sinden, yoksa bilgi metninden
+    (örn. "9.521 kayıttan 1 - 10 arasındaki kayıtlar") okur. Bulunamazsa None.
+    """
+    info = page_info(driver, table)
+    if info is not None:
+        return info["recordsDisplay"]
+
+    state = table_state(driver, table)
+    text = state["info"] if state else ""
+    match = re.search(r'([\d.,]+)\s*kayıt', text) or re.search(r'of\s+([\d.,]+)', text)
+    if match:
+        return int(re.sub(r'[.,]', '', match.group(1)))
+    return None
+
+
+# DataTables API ile verilen sayfaya (0 tabanlı) atlar
+_GO_TO_PAGE = """
+var table = arguments[0] || 'mydata';
+if (!window.jQuery || !jQuery.fn.dataTable || !jQuery.fn.dataTable.isDataTable('#' + table)) { return false; }
+jQuery('#' + table).DataTable().page(arguments[1]).draw('page');
+return true;
+"""
+
+
+def go_to_page(driver, page, table="mydata", timeout=WAIT_TIMEOUT):
+    """
+    Tabloyu 0 tabanlı `page` sayfasına getirir. API yoksa sonraki sayfa düğmesiyle ilerlenir.
+    """
+    if page <= 0:
+        return True
+
+    before = table_state(driver, table)
+    if driver.execute_script(_GO_TO_PAGE, table, page):
+        wait_for_redraw(driver, before, table, timeout)
+        return True
+
+    for _ in range(page):
+        if not click_next_page(driver, table, timeout):
+            return False
+    return True
+
+
+# Geçerli sayfayı (sunucu taraflı tabloda tekrar istek atarak) yeniden çizer
+_REDRAW_PAGE = """
+var table = arguments[0] || 'mydata';
+if (!window.jQuery || !jQuery.fn.dataTable || !jQuery.fn.dataTable.isDataTable('#' + table)) { return false; }
+jQuery('#' + table).DataTable().draw('page');
+return true;
+"""
+
+
+def redraw_page(driver, table="mydata", timeout=WAIT_TIMEOUT):
+    """
+    Geçerli sayfayı yeniden çizer ve çizimi bekler. API yoksa ya da tablo yeniden
+    çizilmezse False döner.
+    """
+    before = table_state(driver, table)
+    if not driver.execute_script(_REDRAW_PAGE, table):
+        return False
+    try:
+        wait_for_redraw(driver, before, table, timeout)
+    except TimeoutException:
+        return False
+    return True
+
+
+# İstemci tarafı tablonun tüm sayfalardaki satırlarını tek çağrıda döndürür
+_DUMP_ROWS = """
+var table = arguments[0] || 'mydata';
+if (!window.jQuery || !jQuery.fn.dataTable || !jQuery.fn.dataTable.isDataTable('#' + table)) { return null; }
+var api = jQuery('#' + table).DataTable();
+if (api.page.info().serverSide) { return null; }
+return api.rows().data().toArray();
+"""
+
+
+def dump_rows(driver, table="mydata"):
+    """
+    Tablonun bütün sayfalarındaki satırları (hücre HTML listeleri) tek `execute_script` ile döndürür.
+    Tablo sunucu taraflıysa ya da API yoksa None döner; bu durumda sayfalar tek tek gezilmelidir.
+    """
+    return driver.execute_script(_DUMP_ROWS, table)
@@ -0,0 +1,184 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.edge.options import Options as eoptions
+from selenium.webdriver.firefox.options import Options as foptions
+
+MAX_PAGES = 200  # Bir sürücü bu kadar sayfadan sonra yenilenir
+
+
+def create_driver(browser="firefox", headless=True, proxy=None):
+    """
+    İstenen tarayıcı için yeni bir WebDriver oluşturur. `proxy` ("ip:port") verilirse
+    tarayıcının tüm HTTP/HTTPS trafiği bu proxy üzerinden geçer.
+    """
+    if browser == "edge":
+        options = eoptions()
+        if headless:
+            options.add_argument("--headless=new")
+        if proxy:
+            options.add_argument(f"--proxy-server=http://{proxy}")
+        driver = webdriver.Edge(options=options)
+    else:
+        options = foptions()
+        if headless:
+            options.add_argument("-headless")
+        if proxy:
+            host, port = proxy.rsplit(":", 1)
+            options.set_preference("network.proxy.type", 1)
+            options.set_preference("network.proxy.http", host)
+            options.set_preference("network.proxy.http_port", int(port))
+            options.set_preference("network.proxy.ssl", host)
+            options.set_preference("network.proxy.ssl_port", int(port))
+        driver = webdriver.Firefox(options=options)
+    driver.maximize_window()
+    driver.proxy = proxy  # Hız sınırlayıcı proxy başına anahtar tutar
+    return driver
+
+
+def is_healthy(driver):
+    """
+    Sürücünün hâlâ komut kabul edip etmediğini kontrol eder.
+    """
+    try:
+        driver.execute_script("return document.readyState")
+        return True
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """
+    Uzun ömürlü WebDriver havuzu. Sürücüler bölümler arasında tekrar kullanılır,
+    `max_pages` sayfadan sonra ya da çöktüğünde kapatılıp yenisi açılır.
+    `proxy_pool` verilirse her sürücü açılırken havuzdan bir proxy alır ve kapanana kadar
+    onu kullanır; çöken sürücünün proxy'si başarısız sayılır. Sürücü bekleyenler bir sürücü
+    geri verildiğinde ya da kapatılan sürücünün yeri boşaldığında uyandırılır.
+    """
+
+    def __init__(self, size=4, browser="firefox", headless=True, max_pages=MAX_PAGES, proxy_pool=None):
+        self.size = max(1, size)
+        self.browser = browser
+        self.headless = headless
+        self.max_pages = max_pages
+        self.proxy_pool = proxy_pool
+
+        self._idle = deque()
+        self._uses = {}
+        self._proxies = {}
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._open = 0
+        self._closed = False
+
+        self.created = 0
+        self.recycled = 0
+
+    def _new_driver(self):
+        proxy = None
+        try:
+            if self.proxy_pool is not None:
+                proxy = self.proxy_pool.acquire()
+            driver = create_driver(self.browser, self.headless, proxy)
+        except Exception:
+            with self._lock:
+                self._open -= 1
+                self._available.notify()
+            if proxy is not None:
+                self.proxy_pool.release(proxy, ok=False)
+            raise
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self._proxies[id(driver)] = proxy
+            self.created += 1
+        return driver
+
+    def _discard(self, driver, broken=False):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            proxy = self._proxies.pop(id(driver), None)
+            self._open -= 1
+            self.recycled += 1
+            self._available.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        if proxy is not None:
+            self.proxy_pool.release(proxy, ok=not broken)
+
+    def acquire(self, timeout=None):
+        """
+        Havuzdan sağlıklı bir sürücü alır; gerekirse yenisini açar. Boşta sürücü ve boş yer
+        yoksa biri geri verilene ya da kapatılana kadar bekler (`timeout` aşılırsa TimeoutError).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._available:
+                while not self._idle and self._open >= self.size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("Boş sürücü beklenirken zaman aşımı oluştu.")
+                    self._available.wait(remaining)
+                driver = self._idle.popleft() if self._idle else None
+                if driver is None:
+                    self._open += 1
+
+            if driver is None:
+                return self._new_driver()
+            if is_healthy(driver):
+                return driver
+            self._discard(driver, broken=True)
+
+    def release(self, driver, broken=False):
+        """
+        Sürücüyü havuza geri verir. Bozuksa ya da kullanım sınırını aştıysa kapatır.
+        """
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            worn_out = self._uses[id(driver)] >= self.max_pages
+
+        if broken or worn_out or self._closed:
+            self._discard(driver, broken)
+        else:
+            with self._available:
+                self._idle.append(driver)
+                self._available.notify()
+
+    @contextmanager
+    def driver(self):
+        """
+        `with pool.driver() as driver:` biçiminde kullanım için sürücü sağlar.
+        """
+        driver = self.acquire()
+        try:
+            yield driver
+        except WebDriverException:
+            self.release(driver, broken=True)
+            raise
+        except BaseException:
+            self.release(driver, broken=not is_healthy(driver))
+            raise
+        else:
+            self.release(driver)
+
+    def close(self):
+        """
+        Havuzdaki tüm boşta sürücüleri kapatır.
+        """
+        self._closed = True
+        with self._lock:
+            drivers = list(self._idle)
+            self._idle.clear()
+        for driver in drivers:
+            self._discard(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
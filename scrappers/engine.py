@@ -0,0 +1,272 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+
+from scrappers.datatables import (
+    click_next_page,
+    expected_records,
+    go_to_page,
+    maximize_page_length,
+    page_info,
+    redraw_page,
+    table_state,
+    wait_for_table,
+)
+from scrappers.driver_pool import create_driver
+from scrappers.http_engine import save_records
+from scrappers.listing_parser import parse_listing_html
+from scrappers.pipeline import PARSE_WORKERS, PagePipeline
+from scrappers.score_types import SCORE_TYPES, get_score_type
+from utils.change_detection import record_changes
+from utils.checkpoint import Checkpoint
+from utils.page_cache import CACHE_DIR, PageCache
+from utils.proxy_checker import RESULT_FILE
+from utils.proxy_pool import ProxyPool
+from utils.rate_limiter import EMPTY_TABLE_TEXT, LIMITER, limiter_key
+from utils.table_store import parquet_path
+
+MAX_WORKERS = 5  # Aynı anda açık tutulacak tarayıcı sayısı
+MAX_PAGE_VISITS = 5000  # Sonraki sayfa düğmesi hiç kapanmazsa güvenlik sınırı
+EMPTY_RETRIES = 3  # Satır beklenirken boş gelen sayfa bu kadar kez yeniden çizilir
+CHECKPOINT_DIR = "data/checkpoints"
+
+
+def restored_pages(checkpoint, length):
+    """
+    Kontrol noktasındaki, aynı sayfa uzunluğuyla alınmış ardışık sayfaları döndürür.
+    """
+    pages = {}
+    for entry in checkpoint.entries():
+        if entry.get("length") == length:
+            pages[entry["key"]] = entry["records"]
+
+    restored = []
+    while len(restored) + 1 in pages:
+        restored.append(pages[len(restored) + 1])
+    return restored
+
+
+def scrape_listing(driver, score_type, max_length=True, checkpoint=None, resume=False, cache=None, executor=None):
+    """
+    Bir puan türünün tercih sihirbazı tablosunu sayfa sayfa gezerek kayıtları döndürür.
+    `max_length` açıksa önce sayfa uzunluğu tablonun kabul ettiği en büyük değere çekilir.
+    Sonraki sayfa düğmesi devre dışı kalana kadar gezilir; (kayıtlar, sayfa sayısı,
+    beklenen kayıt sayısı) döndürülür. `checkpoint` verilirse her sayfa diske yazılır,
+    `resume` açıksa son tamamlanan sayfadan devam edilir. `cache` verilirse her sayfanın
+    kaynağı önbelleğe yazılır. Sayfa istekleri paylaşılan hız sınırlayıcıdan geçer; satır
+    beklenirken boş gelen sayfa beklemeden sonra yeniden çizilir, hep boş gelirse hata fırlatılır.
+    `executor` (süreç havuzu) verilirse sayfalar tarayıcı sonraki sayfaya geçerken paralel
+    ayrıştırılır.
+    """
+    key = limiter_key(score_type.url, getattr(driver, "proxy", None))
+    LIMITER.wait(key)
+    start_time = time.time()
+    driver.get(score_type.url)
+    wait_for_table(driver)
+    LIMITER.report(key, latency=time.time() - start_time)
+
+    if max_length:
+        info = maximize_page_length(driver)
+        if info:
+            print(f"[{score_type.puan}] Sayfa uzunluğu {info['length']}, {info['pages']} sayfa gezilecek.")
+
+    expected = expected_records(driver)
+    info = page_info(driver)
+    length = info["length"] if info else None
+
+    records = []
+    pages = 0
+    if checkpoint is not None and resume:
+        restored = restored_pages(checkpoint, length)
+        if restored:
+            for page_records in restored:
+                records.extend(page_records)
+            pages = len(restored)
+            print(f"[{score_type.puan}] Kontrol noktasından {pages} sayfa ({len(records)} satır) yüklendi.")
+            if info and pages >= info["pages"]:
+                return records, pages, expected
+            if not go_to_page(driver, pages):
+                return records, pages, expected
+
+    def save_page(page, page_records):
+        if checkpoint is not None:
+            checkpoint.append(page, page_records, length=length)
+
+    # Tarayıcı sadece gezer; sayfalar `executor` süreçlerinde ayrıştırılır
+    pipeline = PagePipeline(executor, parse_listing_html, on_result=save_page)
+    def page_is_empty():
+        state = table_state(driver)
+        return bool(expected) and state is not None and state["rows"] <= 1 and EMPTY_TABLE_TEXT in state["first"]
+
+    while pages < MAX_PAGE_VISITS:
+        for attempt in range(EMPTY_RETRIES):
+            if not page_is_empty():
+                break
+            # Satır beklenirken boş gelen tablo gövdesi genellikle sunucunun yavaşlattığını gösterir;
+            # beklemeden sonra aynı sayfa tekrar istenir
+            LIMITER.throttled(key, "empty")
+            LIMITER.wait(key)
+            redraw_page(driver)
+        else:
+            if page_is_empty():
+                raise RuntimeError(f"[{score_type.puan}] {pages + 1}. sayfa {EMPTY_RETRIES} denemede boş geldi.")
+        html = driver.page_source
+        pages += 1
+        pipeline.submit(pages, html, score_type.puan, score_type.years)
+        if cache is not None:
+            cache.put(score_type.url, html, {"page": pages, "length": length})
+
+        LIMITER.wait(key)
+        start_time = time.time()
+        if not click_next_page(driver):
+            break
+        LIMITER.report(key, latency=time.time() - start_time)
+
+    for _, page_records in pipeline.results():
+        records.extend(page_records)
+    return records, pages, expected
+
+
+def replay_listing(score_type, cache):
+    """
+    Önbellekteki listeleme sayfalarını tarayıcı açmadan ayrıştırır.
+    En son kaydedilen sayfa uzunluğuna ait sayfalar sırayla kullanılır.
+    """
+    cached = {}
+    for params, html in cache.entries(score_type.url):
+        cached.setdefault(params.get("length"), {})[params.get("page")] = html
+    if not cached:
+        raise KeyError(f"{score_type.url} için önbellekte sayfa bulunamadı.")
+
+    # entries() eskiden yeniye sıralı olduğu için son eklenen uzunluk en günceldir
+    pages = cached[list(cached)[-1]]
+    records = []
+    for page in sorted(pages):
+        records.extend(parse_listing_html(pages[page], score_type.puan, score_type.years))
+    return records, len(pages), None
+
+
+def checkpoint_path(score_type):
+    return os.path.join(CHECKPOINT_DIR, f"listing_{score_type.key}.jsonl")
+
+
+def scrape_score_type(key, headless=True, max_length=True, resume=False, cache=None, proxy_pool=None,
+                      executor=None, excel=False):
+    """
+    Tek bir puan türünü kendi tarayıcısında çeker, kaydeder ve istatistik döndürür.
+    Çekim başarıyla kaydedildiğinde kontrol noktası silinir. `cache` replay modundaysa
+    tarayıcı açılmaz, sayfalar önbellekten ayrıştırılır. `proxy_pool` verilirse tarayıcı
+    havuzdan seçilen proxy üzerinden açılır, `executor` verilirse sayfalar bu süreç
+    havuzunda ayrıştırılır. Kayıtlar Parquet'e, `excel` açıksa Excel'e de yazılır.
+    """
+    score_type = get_score_type(key)
+    start_time = time.time()
+
+    checkpoint = Checkpoint(checkpoint_path(score_type))
+    if cache is not None and cache.replay:
+        records, pages, expected = replay_listing(score_type, cache)
+    else:
+        if not resume:
+            checkpoint.reset()
+
+        proxy = proxy_pool.acquire() if proxy_pool is not None else None
+        ok = False
+        try:
+            driver = create_driver("firefox", headless, proxy)
+            try:
+                records, pages, expected = scrape_listing(
+                    driver, score_type, max_length, checkpoint, resume, cache, executor
+                )
+                ok = True
+            finally:
+                driver.quit()
+        finally:
+            if proxy is not None:
+                proxy_pool.release(proxy, ok)
+
+    save_records(records, score_type.output, excel)
+    checkpoint.reset()
+    if cache is None or not cache.replay:
+        record_changes(f"listing_{score_type.key}", records)
+    elapsed = time.time() - start_time
+    return {
+        "puan": score_type.puan,
+        "rows": len(records),
+        "expected": expected,
+        "pages": pages,
+        "seconds": elapsed,
+        "rows_per_sec": len(records) / elapsed if elapsed else 0.0,
+        "output": parquet_path(score_type.output),
+    }
+
+
+def print_stats(stats):
+    expected = stats["expected"] if stats["expected"] is not None else "?"
+    print(
+        f"[{stats['puan']}] {stats['rows']} satır (beklenen: {expected}), {stats['pages']} sayfa, "
+        f"{stats['seconds']:.1f} saniye ({stats['rows_per_sec']:.1f} satır/sn) -> {stats['output']}"
+    )
+    if stats["expected"] is not None and stats["rows"] != stats["expected"]:
+        print(f"[{stats['puan']}] UYARI: çekilen satır sayısı beklenenden farklı.")
+
+
+def run(keys=None, workers=MAX_WORKERS, headless=True, max_length=True, resume=False, cache=None,
+        proxy_pool=None, parse_workers=PARSE_WORKERS, excel=False):
+    """
+    Verilen puan türlerini tarayıcı havuzunda paralel olarak çeker. Tüm tarayıcıların
+    sayfaları `parse_workers` süreçlik ortak bir havuzda ayrıştırılır (0 ise aynı iş parçacığında).
+    """
+    keys = [get_score_type(key).key for key in (keys or SCORE_TYPES)]
+    start_time = time.time()
+    results = []
+
+    with ProcessPoolExecutor(parse_workers) if parse_workers else nullcontext() as parsers, \
+            ThreadPoolExecutor(max_workers=max(1, min(workers, len(keys)))) as executor:
+        futures = {
+            executor.submit(
+                scrape_score_type, key, headless, max_length, resume, cache, proxy_pool, parsers, excel
+            ): key
+            for key in keys
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                stats = future.result()
+                print_stats(stats)
+                results.append(stats)
+            except Exception as e:
+                print(f"[{key.upper()}] çekilirken hata oluştu: {e}")
+
+    elapsed = time.time() - start_time
+    total_rows = sum(stats["rows"] for stats in results)
+    print(f"Toplam {total_rows} satır, {elapsed:.1f} saniye ({total_rows / elapsed if elapsed else 0:.1f} satır/sn).")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tercih sihirbazı tablolarını paralel olarak çeker.")
+    parser.add_argument("types", nargs="*", default=list(SCORE_TYPES), help="Puan türleri (say ea söz dil tyt)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--show", action="store_true", help="Tarayıcıyı görünür modda çalıştır")
+    parser.add_argument("--paging", action="store_true", help="Sayfa uzunluğunu büyütmeden sayfa sayfa gez")
+    parser.add_argument("--resume", action="store_true", help="Son tamamlanan sayfadan devam et")
+    parser.add_argument("--cache", default=CACHE_DIR, help="Sayfa önbelleği klasörü")
+    parser.add_argument("--no-cache", action="store_true", help="Sayfaları önbelleğe yazma")
+    parser.add_argument("--replay", action="store_true", help="Tarayıcı açmadan önbellekteki sayfaları ayrıştır")
+    parser.add_argument("--proxies", nargs="?", const=RESULT_FILE,
+                        help="Tarayıcıları bu dosyadaki proxy'ler üzerinden aç (varsayılan: proxy_valid.txt)")
+    parser.add_argument("--parse-workers", type=int, default=PARSE_WORKERS,
+                        help="Sayfaları ayrıştıran süreç sayısı (0: tarayıcı iş parçacığında ayrıştır)")
+    parser.add_argument("--excel", action="store_true", help="Parquet'e ek olarak Excel kopyası da yaz")
+    args = parser.parse_args()
+
+    cache = None if args.no_cache and not args.replay else PageCache(args.cache, replay=args.replay)
+    proxy_pool = ProxyPool.from_file(args.proxies) if args.proxies else None
+    run(args.types, args.workers, headless=not args.show, max_length=not args.paging, resume=args.resume,
+        cache=cache, proxy_pool=proxy_pool, parse_workers=args.parse_workers, excel=args.excel)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import httpx
+
+from scrappers.listing_parser import LISTING_COLUMNS, parse_listing_html, rows_to_html
+from scrappers.score_types import SCORE_TYPES, get_score_type
+from utils.change_detection import record_changes
+from utils.page_cache import CACHE_DIR, PageCache
+from utils.proxy_checker import RESULT_FILE
+from utils.http_client import CLIENT
+from utils.proxy_pool import ProxyPool
+from utils.rate_limiter import LIMITER, limiter_key
+from utils.table_store import parquet_path, write_table
+
+PAGE_LENGTH = 1000  # Tek istekte istenecek satır sayısı
+COLUMN_COUNT = 13  # #mydata tablosundaki sütun sayısı
+RETRIES = 3  # Başarısız istek bu kadar kez (proxy ile çekimde her seferinde farklı proxy) denenir
+
+HEADERS = {
+    "X-Requested-With": "XMLHttpRequest",
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+}
+
+
+def build_form(start, length, draw=1):
+    """
+    DataTables sunucu tarafı işlem parametrelerini oluşturur.
+    """
+    form = {
+        "draw": draw,
+        "start": start,
+        "length": length,
+        "search[value]": "",
+        "search[regex]": "false",
+    }
+    for column in range(COLUMN_COUNT):
+        form[f"columns[{column}][data]"] = column
+        form[f"columns[{column}][searchable]"] = "true"
+        form[f"columns[{column}][orderable]"] = "true"
+        form[f"columns[{column}][search][value]"] = ""
+        form[f"columns[{column}][search][regex]"] = "false"
+    return form
+
+
+def recording_name(score_key, start, length):
+    """
+    Kaydedilen/tekrar oynatılan yanıtın dosya adını döndürür.
+    """
+    return f"{score_key}_{start}_{length}.json"
+
+
+def parse_response(text, score_type):
+    """
+    Veri kaynağı yanıtını ayrıştırır: (kayıtlar, toplam kayıt sayısı).
+    Yanıt JSON değilse HTML tablo olarak ayrıştırılır.
+    """
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return parse_listing_html(text, score_type.puan, score_type.years), None
+
+    total = payload.get("recordsFiltered", payload.get("recordsTotal"))
+    rows = payload.get("data") or payload.get("aaData") or []
+    records = parse_listing_html(rows_to_html(rows), score_type.puan, score_type.years) if rows else []
+    return records, int(total) if total is not None else None
+
+
+def post_page(client, score_type, start, length, data_url=None, proxy_pool=None):
+    """
+    Sayfa penceresi isteğini gönderir. İstekler sunucu/proxy başına paylaşılan hız
+    sınırlayıcıdan geçer; 429/5xx ya da bağlantı hatasında sınırlayıcı yavaşlatılır ve istek
+    tekrar denenir. `proxy_pool` verilirse her deneme havuzdan seçilen bir proxy ile yapılır.
+    Proxy'ye sadece isteğin kendi süresi gecikme olarak yazılır (sınırlayıcı beklemesi hariç);
+    429/5xx sunucu yanıtı olduğundan proxy hatası sayılmaz, sadece bağlantı hataları sayılır.
+    """
+    url = data_url or score_type.data_url
+    request = dict(
+        data=build_form(start, length, draw=start // max(length, 1) + 1),
+        headers={**HEADERS, "Referer": score_type.url},
+    )
+
+    for attempt in range(RETRIES):
+        proxy = proxy_pool.acquire() if proxy_pool is not None else None
+        key = limiter_key(url, proxy)
+        proxy_ok, latency = False, None
+        try:
+            LIMITER.wait(key)
+            start_time = time.time()
+            try:
+                response = client.post(url, proxy, **request)
+            except httpx.TransportError:
+                LIMITER.throttled(key, "error")
+                raise
+            latency = time.time() - start_time
+            proxy_ok = True
+            LIMITER.report(key, response.status_code, latency=latency)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            if attempt == RETRIES - 1:
+                raise
+            print(f"[{score_type.puan}] {start}. satırdan itibaren istek başarısız ({e}), tekrar deneniyor.")
+        finally:
+            if proxy is not None:
+                proxy_pool.release(proxy, ok=proxy_ok, latency=latency)
+
+
+def fetch_page(client, score_type, start, length, data_url=None, record_dir=None, cache=None, proxy_pool=None):
+    """
+    Veri kaynağından tek bir sayfa penceresini çeker ve yanıt metnini döndürür.
+    `cache` verilirse çekilen yanıt önbelleğe yazılır; önbellekten sadece replay modunda
+    okunur, böylece canlı çekim her zaman güncel yanıtları kullanır. Önbellek anahtarı gerçekten
+    istenen adrestir; `data_url` ile başka sunucudan (örn. yerel kayıt sunucusu) çekilen
+    yanıtlar gerçek sunucunun yanıtları yerine kullanılmaz.
+    """
+    cache_url = data_url or score_type.data_url
+    params = {"start": start, "length": length}
+    if cache is not None and cache.replay:
+        return cache.fetch(cache_url, None, params)
+
+    response = post_page(client, score_type, start, length, data_url, proxy_pool)
+
+    if record_dir:
+        os.makedirs(record_dir, exist_ok=True)
+        path = os.path.join(record_dir, recording_name(score_type.key, start, length))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(response.text)
+    if cache is not None:
+        cache.put(cache_url, response.text, params)
+
+    return response.text
+
+
+def fetch_listing(score_key, client=None, page_length=PAGE_LENGTH, data_url=None, record_dir=None, cache=None,
+                  proxy_pool=None):
+    """
+    Bir puan türünün tüm listeleme kayıtlarını tarayıcı kullanmadan çeker.
+    Selenium scraperları ile aynı sütunlarda kayıtlar döndürür. `proxy_pool` verilirse
+    ilk sayfadan sonra kalan pencereler proxy'ler üzerinden paralel çekilir.
+    """
+    score_type = get_score_type(score_key)
+    client = client or CLIENT
+
+    if proxy_pool is not None:
+        return fetch_listing_parallel(score_type, client, page_length, data_url, record_dir, cache, proxy_pool)
+
+    records = []
+    start = 0
+    total = None
+
+    while total is None or start < total:
+        text = fetch_page(client, score_type, start, page_length, data_url, record_dir, cache)
+        page_records, page_total = parse_response(text, score_type)
+        if page_total is not None:
+            total = page_total
+
+        if not page_records:
+            break
+
+        records.extend(page_records)
+        start += len(page_records)
+
+        # Toplam bilinmiyorsa kısa gelen sayfa son sayfadır
+        if total is None and len(page_records) < page_length:
+            break
+
+    print(f"[{score_type.puan}] {len(records)} kayıt çekildi (beklenen: {total if total is not None else '?'}).")
+    return records
+
+
+def fetch_listing_parallel(score_type, client, page_length, data_url, record_dir, cache, proxy_pool):
+    """
+    İlk pencereden toplam kayıt sayısını öğrenir, kalan pencereleri proxy havuzunun
+    kapasitesi kadar iş parçacığıyla paralel çeker. Kayıtlar pencere sırasıyla birleştirilir.
+    Pencereler ilk pencerenin döndürdüğü satır sayısı kadar kaydırılır (sunucu `page_length`
+    değerini sınırlayabilir); eksik dönen pencerelerin kalanı tekrar istenir.
+    """
+    text = fetch_page(client, score_type, 0, page_length, data_url, record_dir, cache, proxy_pool)
+    records, total = parse_response(text, score_type)
+    if total is None or not records:
+        print(f"[{score_type.puan}] Toplam kayıt sayısı alınamadı, {len(records)} kayıt çekildi.")
+        return records
+
+    step = len(records)
+
+    def fetch(start):
+        end = min(start + step, total)
+        window = []
+        while start + len(window) < end:
+            offset = start + len(window)
+            page_text = fetch_page(client, score_type, offset, page_length, data_url, record_dir, cache, proxy_pool)
+            page_records = parse_response(page_text, score_type)[0]
+            if not page_records:
+                raise RuntimeError(f"[{score_type.puan}] {offset}. satırdan itibaren kayıt dönmedi.")
+            window.extend(page_records[:end - offset])
+        return window
+
+    starts = list(range(step, total, step))
+    workers = max(1, min(proxy_pool.capacity(), len(starts)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for page_records in executor.map(fetch, starts):
+            records.extend(page_records)
+
+    if len(records) < total:
+        raise RuntimeError(f"[{score_type.puan}] {len(records)} kayıt çekildi, {total} bekleniyordu.")
+
+    print(
+        f"[{score_type.puan}] {len(records)} kayıt çekildi (beklenen: {total}), "
+        f"{proxy_pool.requests} istek, {proxy_pool.failures} başarısız, {len(proxy_pool.active())} aktif proxy."
+    )
+    return records
+
+
+def save_records(records, output, excel=False):
+    """
+    Kayıtları Parquet'e yazar, son4_* sütunları liste olarak saklanır (bkz. utils.table_store).
+    `excel` açıksa Selenium scraperları ile aynı biçimde Excel kopyası da yazılır.
+    """
+    write_table(pd.DataFrame(records, columns=LISTING_COLUMNS), output, excel=excel, index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YÖK Atlas listeleme tablolarını HTTP ile çeker.")
+    parser.add_argument("types", nargs="*", default=list(SCORE_TYPES), help="Puan türleri (say ea söz dil tyt)")
+    parser.add_argument("--page-length", type=int, default=PAGE_LENGTH)
+    parser.add_argument("--base-url", help="Veri kaynağı yerine kullanılacak sunucu (örn. http://127.0.0.1:8765/)")
+    parser.add_argument("--record", help="Yanıtların kaydedileceği klasör")
+    parser.add_argument("--cache", default=CACHE_DIR, help="Yanıt önbelleği klasörü")
+    parser.add_argument("--no-cache", action="store_true", help="Yanıtları önbelleğe yazma")
+    parser.add_argument("--replay", action="store_true", help="Ağa çıkmadan önbellekteki yanıtları ayrıştır")
+    parser.add_argument("--proxies", nargs="?", const=RESULT_FILE,
+                        help="İstekleri bu dosyadaki proxy'lere dağıt (varsayılan: utils/proxy_valid.txt)")
+    parser.add_argument("--excel", action="store_true", help="Parquet'e ek olarak Excel kopyası da yaz")
+    args = parser.parse_args()
+
+    cache = None if args.no_cache and not args.replay else PageCache(args.cache, replay=args.replay)
+    proxy_pool = ProxyPool.from_file(args.proxies) if args.proxies else None
+
+    for key in args.types:
+        score_type = get_score_type(key)
+        data_url = None
+        if args.base_url:
+            data_url = args.base_url.rstrip("/") + "/" + score_type.data_url.split("/")[-1]
+
+        start_time = time.time()
+        records = fetch_listing(score_type.key, CLIENT, args.page_length, data_url, args.record, cache, proxy_pool)
+        save_records(records, score_type.output, args.excel)
+        if not args.replay:
+            record_changes(f"listing_{score_type.key}", records)
+        print(f"[{score_type.puan}] {parquet_path(score_type.output)} dosyasına kaydedildi "
+              f"({time.time() - start_time:.2f} saniye).")
+    CLIENT.print_stats()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,535 @@
+import glob
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from lxml import etree, html as lxml_html
+from selenium.webdriver.common.by import By
+
+from scrappers.datatables import click_next_page, dump_rows, maximize_page_length, page_info, wait_for_table
+from scrappers.driver_pool import MAX_PAGES, DriverPool
+from scrappers.listing_parser import element_text, rows_to_html
+from utils.change_detection import ChangeTracker, record_changes, yop_key
+from utils.checkpoint import Checkpoint
+from utils.rate_limiter import EMPTY_TABLE_TEXT, LIMITER, limiter_key
+from utils.record_sink import RecordSink
+from utils.table_store import read_table, write_table
+from utils.work_queue import DONE, FAILED, IN_FLIGHT, PENDING, WorkQueue, missing_net_yops
+
+PROGRESS_EVERY = 10  # Her bu kadar bölümde bir ilerleme yazdırılır
+EMPTY_RETRIES = 3  # Boş tablo gelen bölüm sayfası bu kadar kez tekrar yüklenir
+CHECKPOINT_DIR = "data/checkpoints"
+QUEUE_DIR = "data/queues"
+TITLE_XPATH = '/html/body/div[1]/div[2]/div[2]/div[1]/div[1]/div/h2/strong'
+
+_ROWS = etree.XPath('//*[@id="mydata"]/tbody/tr')
+_CELLS = etree.XPath('./td')
+_YOP_LINK = etree.XPath('./td[2]/small/a')
+
+TYT_COLUMNS = [
+    ("TYT Temel Matematik", 10),
+    ("TYT Fen Bilimleri", 11),
+    ("TYT Türkçe", 8),
+    ("TYT Sosyal Bilimler", 9),
+]
+
+# Puan türüne göre (sütun adı, td indeksi) eşleşmeleri
+NET_COLUMNS = {
+    "SAY": TYT_COLUMNS + [
+        ("AYT Matematik", 12),
+        ("AYT Fizik", 13),
+        ("AYT Kimya", 14),
+        ("AYT Biyoloji", 15),
+    ],
+    "SÖZ": TYT_COLUMNS + [
+        ("AYT Türk Dili ve Edebiyatı", 12),
+        ("AYT Coğrafya-1", 14),
+        ("AYT Coğrafya-2", 16),
+        ("AYT Tarih-1", 13),
+        ("AYT Tarih-2", 15),
+        ("AYT Felsefe Grubu", 17),
+        ("AYT Din Kültürü ve Ahlak Bilgisi", 18),
+    ],
+    "EA": TYT_COLUMNS + [
+        ("AYT Türk Dili ve Edebiyatı", 13),
+        ("AYT Matematik", 12),
+        ("AYT Coğrafya-1", 15),
+        ("AYT Tarih-1", 14),
+    ],
+    "DİL": TYT_COLUMNS + [
+        ("AYT Yabancı Dil 1", 12),
+    ],
+    "TYT": TYT_COLUMNS,
+}
+
+STORE_PATHS = {
+    "SAY": "data/say_df.xlsx",
+    "SÖZ": "data/soz_df.xlsx",
+    "EA": "data/ea_df.xlsx",
+    "DİL": "data/dil_df.xlsx",
+    "TYT": "data/tyt_df.xlsx",
+}
+
+# *_df tablolarının sütun sırası
+STORE_COLUMNS = {
+    "SAY": ['yop', 'bolum', 'type', 'TYT Temel Matematik', 'TYT Fen Bilimleri', 'TYT Türkçe', 'TYT Sosyal Bilimler',
+            'AYT Matematik', 'AYT Fizik', 'AYT Kimya', 'AYT Biyoloji'],
+    "SÖZ": ['yop', 'bolum', 'type', 'TYT Temel Matematik', 'TYT Fen Bilimleri', 'TYT Türkçe', 'TYT Sosyal Bilimler',
+            'AYT Türk Dili ve Edebiyatı', 'AYT Coğrafya-1', 'AYT Coğrafya-2', 'AYT Tarih-1', 'AYT Tarih-2',
+            'AYT Felsefe Grubu', 'AYT Din Kültürü ve Ahlak Bilgisi'],
+    "EA": ['yop', 'bolum', 'type', 'TYT Temel Matematik', 'TYT Fen Bilimleri', 'TYT Türkçe', 'TYT Sosyal Bilimler',
+           'AYT Türk Dili ve Edebiyatı', 'AYT Matematik', 'AYT Coğrafya-1', 'AYT Tarih-1'],
+    "DİL": ['yop', 'bolum', 'type', 'TYT Temel Matematik', 'TYT Fen Bilimleri', 'TYT Türkçe', 'TYT Sosyal Bilimler',
+            'AYT Yabancı Dil 1'],
+    "TYT": ['yop', 'bolum', 'type', 'TYT Temel Matematik', 'TYT Fen Bilimleri', 'TYT Türkçe', 'TYT Sosyal Bilimler'],
+}
+
+
+def score_label(type_in_brackets):
+    """
+    Sayfa başlığındaki parantez içi puan türünü NET_COLUMNS anahtarına çevirir.
+    """
+    if type_in_brackets in NET_COLUMNS:
+        return type_in_brackets
+    if 'TYT' in type_in_brackets:
+        return "TYT"
+    return None
+
+
+def bracket_text(title):
+    """
+    Başlıktaki son parantezin içindeki metni döndürür.
+    """
+    last_bracket_index = title.rfind('(')
+    closing_bracket_index = title.rfind(')')
+    if last_bracket_index != -1 and closing_bracket_index > last_bracket_index:
+        return title[last_bracket_index + 1:closing_bracket_index]
+    return "Bilinmiyor"
+
+
+def read_type_in_brackets(driver):
+    """
+    Bölüm sayfasının başlığından parantez içindeki puan türünü okur.
+    """
+    return bracket_text(driver.find_element(By.XPATH, TITLE_XPATH).text)
+
+
+def parse_department_html(page_html, bolum, types=None):
+    """
+    Bölüm sayfasının kaynağını tarayıcı olmadan ayrıştırır ve (puan türü, satırlar) döndürür.
+    """
+    root = lxml_html.fromstring(page_html)
+    title = root.xpath(TITLE_XPATH)
+    type_in_brackets = bracket_text(element_text(title[0]) if title else "")
+    label = score_label(type_in_brackets)
+    if label is None or (types and label not in types):
+        return None, []
+    return label, parse_department_rows(root, bolum, type_in_brackets, label)
+
+
+def parse_department_rows(root, bolum, type_in_brackets, label):
+    """
+    Ayrıştırılmış tablodaki #mydata satırlarından net kayıtlarını çıkarır.
+    """
+    records = []
+    for row in _ROWS(root):
+        cells = _CELLS(row)
+        links = _YOP_LINK(row)
+        if len(cells) < 2 or not links:
+            continue
+        record = {
+            'yop': links[0].get('href').split('=')[1].strip(),
+            'bolum': bolum,
+            'type': type_in_brackets,
+        }
+        for column, td in NET_COLUMNS[label]:
+            record[column] = element_text(cells[td - 1]) if td <= len(cells) else None
+        records.append(record)
+    return records
+
+
+def parse_dumped_rows(rows, bolum, type_in_brackets, label):
+    """
+    `dump_rows` ile alınan satır verisini (hücre HTML listeleri) net kayıtlarına çevirir.
+    """
+    if not rows:
+        return []
+    return parse_department_rows(lxml_html.fromstring(rows_to_html(rows)), bolum, type_in_brackets, label)
+
+
+def replay_department(cache, url, bolum, types=None):
+    """
+    Önbellekteki bölüm sayfalarını ağa çıkmadan ayrıştırır. Tek çağrıda alınmış tablo
+    dökümü varsa o kullanılır.
+    """
+    entries = list(cache.entries(url))
+    for params, text in entries:
+        if params.get("dump"):
+            dump = json.loads(text)
+            label = score_label(dump["type"])
+            if label is None or (types and label not in types):
+                return None, []
+            return label, parse_dumped_rows(dump["rows"], bolum, dump["type"], label)
+
+    pages = {params.get("page"): html for params, html in entries}
+    if not pages:
+        raise KeyError(f"{url} için önbellekte sayfa bulunamadı.")
+
+    label, records = None, []
+    for page in sorted(pages):
+        page_label, page_records = parse_department_html(pages[page], bolum, types)
+        label = label or page_label
+        records.extend(page_records)
+    return label, records
+
+
+def table_is_empty(driver):
+    """
+    Tabloda satır olmadığını ya da sadece boş tablo mesajı olduğunu kontrol eder.
+    """
+    rows = driver.find_elements(By.XPATH, '//*[@id="mydata"]/tbody/tr')
+    return len(rows) == 0 or (len(rows) == 1 and EMPTY_TABLE_TEXT in rows[0].text)
+
+
+def extract_rows(driver, bolum, type_in_brackets, label, max_length=True, cache=None, url=None):
+    """
+    Bölüm sayfasındaki tablonun tüm sayfalarını gezerek net satırlarını döndürür.
+    Tablo tek çağrıda dökülemediğinde (sunucu taraflı tablo) kullanılan yedek yoldur.
+    `max_length` açıksa önce sayfa uzunluğu tablonun kabul ettiği en büyük değere çekilir.
+    `cache` verilirse her sayfanın kaynağı `url` anahtarıyla önbelleğe yazılır.
+    """
+    if table_is_empty(driver):
+        print(f"'{bolum}' bölümü için {EMPTY_TABLE_TEXT}, atlıyorum.")
+        return []
+
+    if max_length:
+        maximize_page_length(driver)
+
+    records = []
+    page = 0
+    has_next_page = True
+    while has_next_page:
+        page += 1
+        if cache is not None:
+            cache.put(url, driver.page_source, {"page": page})
+        row_count = len(driver.find_elements(By.XPATH, '//*[@id="mydata"]/tbody/tr'))
+
+        for x in range(1, row_count + 1):
+            try:
+                record = {
+                    'yop': driver.find_element(By.XPATH, f'//*[@id="mydata"]/tbody/tr[{x}]/td[2]/small/a')
+                                 .get_attribute('href').split('=')[1].strip(),
+                    'bolum': bolum,
+                    'type': type_in_brackets,
+                }
+                for column, td in NET_COLUMNS[label]:
+                    record[column] = driver.find_element(By.XPATH, f'//*[@id="mydata"]/tbody/tr[{x}]/td[{td}]').text
+                records.append(record)
+            except Exception as e:
+                print(f"{label} - Satır {x} işlenirken hata: {e}")
+
+        try:
+            has_next_page = click_next_page(driver)
+        except Exception as e:
+            print(f"'{bolum}' bölümünde sonraki sayfaya geçilemedi: {e}")
+            has_next_page = False
+
+    return records
+
+
+def extract_department(driver, url, bolum, types=None, max_length=True, cache=None):
+    """
+    Tek bir bölüm sayfasını açar ve (puan türü, satırlar) döndürür. Tablo yüklenmezse
+    TimeoutError fırlatılır, böylece bölüm iş kuyruğunda tekrar denenir.
+    `types` verilirse sadece bu puan türleri işlenir. Sayfa yüklemeleri paylaşılan hız
+    sınırlayıcıdan geçer; tablo kayıt bildirdiği halde boş gelirse sınırlayıcı yavaşlatılıp sayfa
+    tekrar yüklenir, hep boş gelirse TimeoutError fırlatılır. Kaydı olmayan bölüm normal sayılır
+    ve tekrar yüklenmez.
+    Tablonun tüm satırları tek `execute_script` ile alınır; bu mümkün değilse sayfalar gezilir.
+    """
+    key = limiter_key(url, getattr(driver, "proxy", None))
+    for attempt in range(EMPTY_RETRIES):
+        LIMITER.wait(key)
+        start_time = time.time()
+        driver.get(url)
+
+        try:
+            wait_for_table(driver, timeout=10)
+        except Exception:
+            LIMITER.throttled(key, "timeout")
+            raise TimeoutError(f"'{bolum}' bölümü için tablo yüklenemedi.")
+
+        info = page_info(driver)
+        if not table_is_empty(driver) or not (info and info["recordsTotal"]):
+            LIMITER.report(key, latency=time.time() - start_time)
+            break
+        LIMITER.throttled(key, "empty")
+    else:
+        # Bölüm boş tamamlanmış sayılmasın; iş kuyruğunda tekrar denenir
+        raise TimeoutError(f"'{bolum}' bölümü {EMPTY_RETRIES} denemede boş geldi.")
+
+    type_in_brackets = read_type_in_brackets(driver)
+    label = score_label(type_in_brackets)
+    if label is None or (types and label not in types):
+        print(f"'{bolum}' bölümü için geçerli puan türü bulunamadı: {type_in_brackets}")
+        return None, []
+
+    rows = dump_rows(driver)
+    if rows is None:
+        return label, extract_rows(driver, bolum, type_in_brackets, label, max_length, cache, url)
+
+    if cache is not None:
+        cache.put(url, json.dumps({"type": type_in_brackets, "rows": rows}, ensure_ascii=False), {"dump": True})
+    return label, parse_dumped_rows(rows, bolum, type_in_brackets, label)
+
+
+def load_stores(types):
+    """
+    Daha önce kaydedilmiş *_df tablolarını (Parquet ya da Excel) yükler.
+    """
+    stores = {}
+    for label in types:
+        path = STORE_PATHS[label]
+        try:
+            df = read_table(path)
+        except Exception as e:
+            print(f"{path} yüklenemedi ({e}), boş tablo ile başlanıyor.")
+            df = pd.DataFrame(columns=STORE_COLUMNS[label])
+        stores[label] = {"df": df, "sink": RecordSink(STORE_COLUMNS[label])}
+    return stores
+
+
+def save_stores(stores, excel=False):
+    """
+    Yeni satırları mevcut tablolarla birleştirip *_df.parquet dosyalarına (`excel` açıksa
+    .xlsx kopyasına da) yazar. Tekrar çekilen YÖP kodlarının eski satırları silinir; eski
+    tablodaki aynı YÖP kodlu birden fazla satır olduğu gibi kalır.
+    """
+    for label, store in stores.items():
+        if len(store["sink"]):
+            new_rows = store["sink"].to_frame()
+            fetched = set(new_rows['yop'].map(yop_key))
+            old_rows = store["df"][~store["df"]['yop'].map(yop_key).isin(fetched)]
+            store["df"] = pd.concat([old_rows, new_rows], ignore_index=True)
+            store["sink"] = RecordSink(STORE_COLUMNS[label])
+        write_table(store["df"], STORE_PATHS[label], excel=excel)
+
+
+def checkpoint_path(unis_last_path, shard=None):
+    name = os.path.splitext(os.path.basename(unis_last_path))[0]
+    if shard is not None:
+        name = f"{name}.{shard}"
+    return os.path.join(CHECKPOINT_DIR, f"last_person_{name}.jsonl")
+
+
+def checkpoint_paths(unis_last_path):
+    """
+    Ana ve süreç başına (parça) kontrol noktası dosyalarını döndürür.
+    """
+    name = os.path.splitext(os.path.basename(unis_last_path))[0]
+    return sorted(
+        glob.glob(os.path.join(CHECKPOINT_DIR, f"last_person_{glob.escape(name)}.jsonl"))
+        + glob.glob(os.path.join(CHECKPOINT_DIR, f"last_person_{glob.escape(name)}.*.jsonl"))
+    )
+
+
+def queue_path(unis_last_path):
+    name = os.path.splitext(os.path.basename(unis_last_path))[0]
+    return os.path.join(QUEUE_DIR, f"last_person_{name}.sqlite3")
+
+
+def fetched_departments():
+    """
+    Önceki çalışmalarda çekilen bölümlerin {URL: YÖP kodları} eşleşmesini bölüm parmak
+    izlerinden (bkz. finish_harvest) döndürür.
+    """
+    tracker = ChangeTracker()
+    try:
+        previous = tracker.previous("department")
+    finally:
+        tracker.close()
+    return {
+        url: {yop_key(record.get('yop')) for record in department.get("records") or []} - {""}
+        for url, (_, department) in previous.items()
+    }
+
+
+def fill_queue(queue, unis_last, stores, json_dir="json"):
+    """
+    `unis_last` içindeki bölümleri URL anahtarıyla kuyruğa ekler. Kuyrukta olmayan bir bölüm
+    sadece bu URL'in daha önce çekildiği biliniyorsa (bkz. fetched_departments), YÖP kodlarının
+    hepsi *_df tablolarında varsa ve hiçbirinin `json/*.json` içinde "Yerlesen_son_kisinin_netleri"
+    alanı boş değilse tamamlanmış olarak eklenir. Öncelik bu eksik programların sayısıdır;
+    daha önce çekildiği bilinmeyen bölümler de öne alınır. Aynı isimli bölümler karıştırılmaz.
+    """
+    missing = missing_net_yops(json_dir)
+    fetched = fetched_departments()
+    stored = set()
+    for store in stores.values():
+        stored.update(store["df"]['yop'].map(yop_key).tolist())
+
+    added = 0
+    for bolum, url in zip(unis_last['bolum'], unis_last['url']):
+        yops = fetched.get(url)
+        if yops is None or not yops <= stored:
+            priority, state, yops = 1, PENDING, ()
+        else:
+            priority = len(yops & missing)
+            state = PENDING if priority else DONE
+        added += queue.add(url, priority, state, yops=yops, bolum=bolum)
+    counts = queue.counts()
+    print(f"Kuyruğa {added} yeni bölüm eklendi; {counts[PENDING]} bekleyen, {counts[DONE]} tamamlanmış, "
+          f"{counts[FAILED]} başarısız bölüm var.")
+
+
+def prepare_harvest(unis_last_path, types, resume=True, changed_yops=None, json_dir="json", changed_at=None):
+    """
+    *_df.xlsx dosyalarını yükler ve iş kuyruğunu hazırlar; (depolar, kuyruk) döndürür.
+    `resume` kapalıysa kuyruk ve kontrol noktaları sıfırlanır. `changed_yops` verilirse bu YÖP
+    kodlarını içeren bölümler (işlerin kendi YÖP kodlarına göre) tekrar kuyruğa alınır; eski
+    satırlar yeni çekilen satırlarla değiştirilir (bkz. save_stores). `changed_at` (raporun
+    oluşturulma zamanı) verilirse bu zamandan sonra zaten tamamlanan bölümler tekrar alınmaz.
+    """
+    unis_last = read_table(unis_last_path, columns=['bolum', 'url'])
+    stores = load_stores(types)
+
+    queue = WorkQueue(queue_path(unis_last_path))
+    if not resume:
+        queue.reset()
+        for path in checkpoint_paths(unis_last_path):
+            Checkpoint(path).reset()
+    fill_queue(queue, unis_last, stores, json_dir)
+    retried = queue.requeue(states=(FAILED,))
+    if retried:
+        print(f"Önceki çalışmada başarısız olan {len(retried)} bölüm tekrar denenecek.")
+
+    if changed_yops:
+        # Yeni ya da değişen programları içeren bölümleri, işlerin kendi YÖP kodlarına göre tekrar kuyruğa al
+        requeued = queue.requeue(yops=changed_yops, before=changed_at)
+        print(f"{len(changed_yops)} değişen program nedeniyle {len(requeued)} bölüm tekrar çekilecek.")
+
+    return stores, queue
+
+
+def harvest_worker(unis_last_path, types=None, shard=None, browser="firefox", workers=4, headless=True,
+                   max_pages=MAX_PAGES, max_length=True, cache=None, proxy_pool=None, on_done=None):
+    """
+    İş kuyruğu boşalana kadar bölümleri çeker. Her tarayıcı iş parçacığı kuyruktan sıradaki en
+    öncelikli bölümü alır; kayıtlar `shard` kontrol noktasına yazıldıktan sonra bölüm tamamlanmış
+    sayılır. Aynı kuyruğu birden fazla süreç birlikte tüketebilir. `on_done(bolum, kayıt sayısı)`
+    her bölümden sonra çağrılır. İşlenen bölüm sayısını döndürür.
+    """
+    types = list(types or NET_COLUMNS)
+    queue = WorkQueue(queue_path(unis_last_path))
+    checkpoint = Checkpoint(checkpoint_path(unis_last_path, shard))
+    done = [0]
+    lock = threading.Lock()
+
+    with DriverPool(workers, browser, headless, max_pages, proxy_pool) as pool:
+
+        def process(url, bolum):
+            if cache is not None and cache.replay:
+                label, records = replay_department(cache, url, bolum, types)
+            else:
+                with pool.driver() as driver:
+                    label, records = extract_department(driver, url, bolum, types, max_length, cache)
+
+            checkpoint.append(url, records, label=label, bolum=bolum)
+            queue.complete(url, [record['yop'] for record in records])
+            with lock:
+                done[0] += 1
+            if on_done is not None:
+                on_done(bolum, len(records))
+
+        def consume(worker):
+            while True:
+                job = queue.claim(f"{os.getpid()}-{worker}")
+                if job is None:
+                    return
+                url, meta = job
+                try:
+                    process(url, meta.get("bolum"))
+                except Exception as e:
+                    print(f"'{meta.get('bolum')}' bölümü işlenirken hata oluştu: {e}")
+                    queue.fail(url, e)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            list(executor.map(consume, range(max(1, workers))))
+
+        print(f"{pool.created} tarayıcı açıldı, {pool.recycled} tarayıcı yenilendi.")
+
+    queue.close()
+    return done[0]
+
+
+def finish_harvest(unis_last_path, stores, queue, record_fingerprints=True, excel=False):
+    """
+    Tüm kontrol noktalarındaki bölüm kayıtlarını depolarla birleştirir, *_df tablolarını
+    bir kez yazar ve kontrol noktalarını siler. Deneme hakkı biten bölümler raporlanır.
+    """
+    fetched = []
+    paths = checkpoint_paths(unis_last_path)
+    for path in paths:
+        for entry in Checkpoint(path).entries():
+            label = entry.get("label")
+            if label in stores:
+                stores[label]["sink"].extend(entry["records"])
+            fetched.append({"url": entry["key"], "bolum": entry.get("bolum"), "records": entry["records"]})
+    print(f"{len(paths)} kontrol noktasından {len(fetched)} bölüm birleştiriliyor.")
+
+    save_stores(stores, excel)
+    for path in paths:
+        Checkpoint(path).reset()
+    if record_fingerprints:
+        # Bölüm sayfalarının parmak izlerini güncelle, değişen bölümleri raporla
+        record_changes("department", fetched, key_field="url", full=False)
+
+    counts = queue.counts()
+    failures = queue.failures()
+    if failures:
+        print(f"{len(failures)} bölüm {queue.max_attempts} denemede çekilemedi:")
+        for url, error in failures.items():
+            print(f"  {url}: {error}")
+    if counts[PENDING] or counts[IN_FLIGHT]:
+        print(f"{counts[PENDING] + counts[IN_FLIGHT]} bölüm tamamlanmadı, sonraki çalışmada devam edilecek.")
+    queue.close()
+
+
+def harvest(unis_last_path, types=None, browser="firefox", workers=4, headless=True, max_pages=MAX_PAGES,
+            max_length=True, resume=True, cache=None, changed_yops=None, proxy_pool=None, json_dir="json",
+            excel=False, changed_at=None):
+    """
+    `unis_last_path` içindeki bölüm URL'lerini sabit sayıda tarayıcıdan oluşan bir havuzla işler
+    ve yerleşen son kişilerin netlerini *_df.parquet dosyalarına (`excel` açıksa .xlsx'e de) kaydeder.
+    Bölümler URL anahtarlı kalıcı bir iş kuyruğundan (bkz. utils.work_queue) alınır; her tarayıcı
+    iş parçacığı kuyruktan sıradaki en öncelikli bölümü çeker. Tamamlanan bölüm tekrar çekilmez,
+    yarıda kalan ya da hata veren bölüm tekrar denenir. Her bölüm bitince kayıtları kontrol
+    noktasına yazılır, *_df tabloları sadece sonda bir kez yazılır. `resume` kapalıysa kuyruk
+    ve kontrol noktası sıfırlanır. `cache` verilirse bölüm sayfaları önbelleğe yazılır; replay
+    modunda tarayıcı açılmadan önbellekten ayrıştırılır.
+    `changed_yops` verilirse (bkz. utils.change_detection.load_changes) bu YÖP kodlarını
+    içeren bölümler daha önce işlenmiş olsa bile tekrar çekilir; `changed_at` (bkz.
+    utils.change_detection.changes_generated_at) ile rapordan sonra çekilenler tekrar çekilmez.
+    `proxy_pool` (bkz. utils.proxy_pool.ProxyPool) verilirse her tarayıcı ayrı bir proxy ile açılır.
+    Birden fazla süreçle çalıştırmak için bkz. scrappers.last_person_runner.
+    """
+    types = list(types or NET_COLUMNS)
+    stores, queue = prepare_harvest(unis_last_path, types, resume, changed_yops, json_dir, changed_at)
+    total = queue.counts()[PENDING]
+    lock = threading.Lock()
+    done = [0]
+
+    def progress(bolum, rows):
+        with lock:
+            done[0] += 1
+            if done[0] % PROGRESS_EVERY == 0:
+                # Ara kayıt yerine kontrol noktası kullanılır, tablolar sadece sonda bir kez yazılır
+                print(f"{done[0]} / {total} bölüm işlendi.")
+
+    harvest_worker(unis_last_path, types, None, browser, workers, headless, max_pages, max_length, cache,
+                   proxy_pool, progress)
+    finish_harvest(unis_last_path, stores, queue, record_fingerprints=cache is None or not cache.replay, excel=excel)
+    print("Tüm veriler başarıyla toplandı ve kaydedildi.")
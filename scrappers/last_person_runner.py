@@ -0,0 +1,158 @@
+import argparse
+import multiprocessing
+import os
+import time
+
+from scrappers.driver_pool import MAX_PAGES
+from scrappers.last_person import NET_COLUMNS, finish_harvest, harvest_worker, prepare_harvest
+from utils.change_detection import changes_generated_at, load_changes
+from utils.page_cache import CACHE_DIR, PageCache
+from utils.proxy_checker import RESULT_FILE
+from utils.proxy_pool import ProxyPool
+from utils.rate_limiter import LIMITER
+from utils.work_queue import PENDING
+
+PROCESSES = max(1, (os.cpu_count() or 2) // 2)  # Varsayılan süreç sayısı (her süreç kendi tarayıcısını açar)
+PROGRESS_INTERVAL = 10  # İlerleme yazdırma aralığı (saniye)
+
+# Puan türüne göre listeleme değişiklik dosyaları (bkz. utils.change_detection)
+LISTING_KINDS = {
+    "SAY": "listing_say",
+    "SÖZ": "listing_söz",
+    "EA": "listing_ea",
+    "DİL": "listing_dil",
+    "TYT": "listing_tyt",
+}
+
+
+def format_duration(seconds):
+    """
+    Süreyi "sa:dk:sn" biçiminde döndürür.
+    """
+    if seconds is None:
+        return "--:--:--"
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def run_shard(shard, unis_last_path, types, browser, workers, headless, max_pages, max_length, cache_dir, replay,
+              use_cache, proxies, departments, rows, processes=1):
+    """
+    Alt süreçte çalışır: kendi tarayıcı havuzuyla ortak kuyruktan bölüm çeker ve kayıtları
+    kendi kontrol noktasına yazar. İlerleme ortak sayaçlara (`departments`, `rows`) eklenir.
+    Süreç başına hız sınırları `processes` sayısına bölünür (bkz. RateLimiter.split).
+    """
+    LIMITER.split(processes)
+    cache = PageCache(cache_dir, replay=replay) if use_cache else None
+    proxy_pool = ProxyPool.from_file(proxies) if proxies else None
+
+    def on_done(bolum, count):
+        with departments.get_lock():
+            departments.value += 1
+        with rows.get_lock():
+            rows.value += count
+
+    harvest_worker(unis_last_path, types, shard, browser, workers, headless, max_pages, max_length, cache,
+                   proxy_pool, on_done)
+
+
+def print_progress(done, total, rows, elapsed):
+    rate = rows / elapsed if elapsed else 0.0
+    department_rate = done / elapsed if elapsed else 0.0
+    eta = (total - done) / department_rate if department_rate else None
+    print(f"{done} / {total} bölüm, {rows} satır, {rate:.1f} satır/sn, "
+          f"geçen {format_duration(elapsed)}, kalan {format_duration(eta)}.")
+
+
+def run(unis_last_path="data/unis_last.xlsx", types=None, processes=PROCESSES, workers=1, browser="firefox",
+        headless=True, max_pages=MAX_PAGES, max_length=True, resume=True, cache_dir=CACHE_DIR, use_cache=True,
+        replay=False, proxies=None, changed=False, json_dir="json", excel=False):
+    """
+    Son kişi netlerini `processes` alt süreçte çeker. Bölümler ortak iş kuyruğundan dağıtılır,
+    her süreç `workers` tarayıcı açar ve kayıtlarını kendi kontrol noktasına yazar. Tüm süreçler
+    bitince kayıtlar bu süreçte birleştirilip *_df tablolarına bir kez yazılır (`excel` açıksa .xlsx'e de).
+    `changed` açıksa son listeleme taramasında değişen programları içeren bölümler tekrar çekilir.
+    Hız sınırlayıcı süreç başına tutulur; sınırlar süreç sayısına bölündüğünden toplam istek hızı
+    tek süreçteki sınırları aşmaz.
+    """
+    types = list(types or NET_COLUMNS)
+    processes = max(1, processes)
+    kinds = [LISTING_KINDS[label] for label in types]
+    changed_yops = load_changes(kinds) if changed else None
+    changed_at = changes_generated_at(kinds) if changed else None
+    stores, queue = prepare_harvest(unis_last_path, types, resume, changed_yops, json_dir, changed_at)
+    total = queue.counts()[PENDING]
+    print(f"{total} bölüm {processes} süreçle çekilecek.")
+
+    context = multiprocessing.get_context("spawn")
+    departments = context.Value('q', 0)
+    rows = context.Value('q', 0)
+    shards = [
+        context.Process(
+            target=run_shard,
+            args=(shard, unis_last_path, types, browser, workers, headless, max_pages, max_length, cache_dir,
+                  replay, use_cache, proxies, departments, rows, processes),
+            name=f"last_person-{shard}",
+        )
+        for shard in range(processes)
+    ]
+
+    start_time = time.time()
+    for process in shards:
+        process.start()
+    try:
+        while any(process.is_alive() for process in shards):
+            for process in shards:
+                process.join(PROGRESS_INTERVAL / len(shards))
+            if any(process.is_alive() for process in shards):
+                print_progress(departments.value, total, rows.value, time.time() - start_time)
+    except KeyboardInterrupt:
+        print("Durduruluyor; tamamlanan bölümler birleştirilecek, kalanlar sonraki çalışmada devam edecek.")
+        for process in shards:
+            process.terminate()
+        for process in shards:
+            process.join()
+        # Durdurulan süreçlerin işlemdeki bölümleri süre dolmasını beklemeden tekrar kuyruğa alınır
+        released = queue.release([f"{process.pid}-" for process in shards if process.pid is not None])
+        if released:
+            print(f"Yarıda kalan {released} bölüm tekrar kuyruğa alındı.")
+
+    for process in shards:
+        if process.exitcode:
+            print(f"{process.name} süreci {process.exitcode} koduyla sonlandı.")
+    print_progress(departments.value, total, rows.value, time.time() - start_time)
+
+    finish_harvest(unis_last_path, stores, queue, record_fingerprints=not replay, excel=excel)
+    print("Tüm veriler başarıyla toplandı ve kaydedildi.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerleşen son kişilerin netlerini birden fazla süreçte çeker.")
+    parser.add_argument("unis_last", nargs="?", default="data/unis_last.xlsx", help="Bölüm URL listesi (Parquet ya da Excel)")
+    parser.add_argument("--types", nargs="*", default=list(NET_COLUMNS), choices=list(NET_COLUMNS), help="Puan türleri")
+    parser.add_argument("--processes", type=int, default=PROCESSES, help="Süreç sayısı")
+    parser.add_argument("--workers", type=int, default=1, help="Süreç başına tarayıcı sayısı")
+    parser.add_argument("--browser", default="firefox", choices=["firefox", "edge"])
+    parser.add_argument("--show", action="store_true", help="Tarayıcıyı görünür modda çalıştır")
+    parser.add_argument("--max-pages", type=int, default=MAX_PAGES, help="Tarayıcı bu kadar sayfadan sonra yenilenir")
+    parser.add_argument("--paging", action="store_true", help="Sayfa uzunluğunu büyütmeden sayfa sayfa gez")
+    parser.add_argument("--restart", action="store_true", help="Kuyruğu ve kontrol noktalarını sıfırlayıp baştan başla")
+    parser.add_argument("--cache", default=CACHE_DIR, help="Sayfa önbelleği klasörü")
+    parser.add_argument("--no-cache", action="store_true", help="Sayfaları önbelleğe yazma")
+    parser.add_argument("--replay", action="store_true", help="Tarayıcı açmadan önbellekteki sayfaları ayrıştır")
+    parser.add_argument("--proxies", nargs="?", const=RESULT_FILE,
+                        help="Tarayıcıları bu dosyadaki proxy'ler üzerinden aç (varsayılan: proxy_valid.txt)")
+    parser.add_argument("--changed", action="store_true",
+                        help="Son listeleme taramasında değişen programları içeren bölümleri tekrar çek")
+    parser.add_argument("--json-dir", default="json", help="Öncelik için okunacak JSON klasörü")
+    parser.add_argument("--excel", action="store_true", help="Parquet'e ek olarak Excel kopyası da yaz")
+    args = parser.parse_args()
+
+    run(args.unis_last, args.types, args.processes, args.workers, args.browser, headless=not args.show,
+        max_pages=args.max_pages, max_length=not args.paging, resume=not args.restart, cache_dir=args.cache,
+        use_cache=args.replay or not args.no_cache, replay=args.replay, proxies=args.proxies,
+        changed=args.changed, json_dir=args.json_dir, excel=args.excel)
+
+
+if __name__ == "__main__":
+    main()
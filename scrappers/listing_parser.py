@@ -0,0 +1,170 @@
+from urllib.parse import urljoin
+
+from lxml import etree, html as lxml_html
+
+BASE_URL = "https://yokatlas.yok.gov.tr/"
+
+# Listeleme tablosunun çıktı sütunları (scrapper_*.py dosyalarındaki sıra ile aynı)
+LISTING_COLUMNS = [
+    "Üniversite İsmi",
+    "fakülte",
+    "bolum",
+    "yop",
+    "burs",
+    "type",
+    "doluluk",
+    "puan",
+    "son4_kont",
+    "son4_yerleşen",
+    "son4_sıralama",
+    "son4_puan",
+    "bolum_url",
+]
+
+# Derlenmiş XPath ifadeleri - her sayfada tekrar tekrar derlenmez
+_TBODY_ROWS = etree.XPath('//*[@id="mydata"]/tbody/tr')
+_CELLS = etree.XPath('./td')
+_STRONG = etree.XPath('./strong[1]')
+_FONT = etree.XPath('./font[1]')
+_FONTS = etree.XPath('./font')
+_LINK = etree.XPath('./a[1]')
+
+
+def element_text(element):
+    """
+    Selenium'un `.text` çıktısına benzer şekilde elementin görünen metnini döndürür.
+    <br> etiketleri satır sonuna çevrilir, her satırdaki boşluklar sadeleştirilir.
+    """
+    lines = (" ".join(line.split()) for line in _ordered_text(element).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _ordered_text(element):
+    """
+    Elementin metnini belge sırasına göre birleştirir, <br> yerine satır sonu koyar.
+    """
+    parts = [element.text or ""]
+    for child in element:
+        if child.tag == "br":
+            parts.append("\n")
+        elif child.tag is not etree.Comment:
+            parts.append(_ordered_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _cell(cells, index):
+    """
+    1 tabanlı td indeksine göre hücreyi döndürür (XPath td[n] ile aynı).
+    """
+    if 0 < index <= len(cells):
+        return cells[index - 1]
+    return None
+
+
+def _first(cell, xpath):
+    if cell is None:
+        return None
+    found = xpath(cell)
+    return found[0] if found else None
+
+
+def _font_values(cell, years):
+    """
+    Hücredeki ilk `years` adet <font> değerini döndürür; eksik varsa None.
+    """
+    if cell is None:
+        return None
+    fonts = _FONTS(cell)
+    if len(fonts) < years:
+        return None
+    return [element_text(font) for font in fonts[:years]]
+
+
+def compute_son4_kont(values):
+    """
+    Kontenjan <font> değerlerinden "asıl+ek" toplamını hesaplar.
+    "---" değerleri "0+0+0+0" kabul edilir.
+    """
+    if values is None:
+        return None
+    try:
+        parts = [("0+0+0+0" if value == "---" else value).split('+') for value in values]
+        asıl = sum(int(part[0]) for part in parts)
+        ek = sum(int(part[1]) for part in parts)
+        ek += sum(int(part[2]) + int(part[3]) for part in parts[:2])
+        return str(asıl) + '+' + str(ek)
+    except Exception:
+        return None
+
+
+def parse_listing_row(cells, puan, years, base_url=BASE_URL):
+    """
+    Bir tablo satırının td elementlerini listeleme kaydına dönüştürür.
+    `years` AYT puan türlerinde 4, TYT için 2'dir.
+    """
+    name = _first(_cell(cells, 3), _STRONG)
+    fakulte = _first(_cell(cells, 3), _FONT)
+    bolum = _first(_cell(cells, 4), _STRONG)
+    link = _first(_cell(cells, 2), _LINK)
+
+    def text_of(element):
+        return element_text(element) if element is not None else None
+
+    href = link.get("href") if link is not None else None
+
+    return {
+        "Üniversite İsmi": text_of(name),
+        "fakülte": text_of(fakulte),
+        "bolum": text_of(bolum),
+        "yop": text_of(link),
+        "burs": text_of(_cell(cells, 7)),
+        "type": text_of(_cell(cells, 8)),
+        "doluluk": text_of(_cell(cells, 10)),
+        "puan": puan,
+        "son4_kont": compute_son4_kont(_font_values(_cell(cells, 9), years)),
+        "son4_yerleşen": _font_values(_cell(cells, 11), years),
+        "son4_sıralama": _font_values(_cell(cells, 12), years),
+        "son4_puan": _font_values(_cell(cells, 13), years),
+        "bolum_url": urljoin(base_url, href) if href is not None else None,
+    }
+
+
+def _is_empty_row(cells):
+    return len(cells) == 1 and "dataTables_empty" in (cells[0].get("class") or "")
+
+
+def rows_to_html(rows):
+    """
+    DataTables JSON satırlarını (hücre HTML listeleri) tbody HTML'ine çevirir.
+    """
+    parts = ['<table id="mydata"><tbody>']
+    for row in rows:
+        if isinstance(row, dict):
+            row = [row[key] for key in sorted(row, key=lambda k: int(k) if str(k).isdigit() else k)]
+        parts.append("<tr>")
+        for cell in row:
+            parts.append(f"<td>{cell if cell is not None else ''}</td>")
+        parts.append("</tr>")
+    parts.append("</tbody></table>")
+    return "".join(parts)
+
+
+def parse_listing_html(page_html, puan, years, base_url=BASE_URL):
+    """
+    Sayfa kaynağını (driver.page_source) ya da #mydata tbody outerHTML'ini tek seferde
+    ayrıştırır ve her satır için listeleme kaydı döndürür.
+    """
+    if 'id="mydata"' not in page_html:
+        # Sadece tbody outerHTML'i verildiyse tabloyu sarmala
+        page_html = f'<table id="mydata">{page_html}</table>'
+    root = lxml_html.fromstring(page_html)
+    rows = _TBODY_ROWS(root)
+
+    records = []
+    for row in rows:
+        cells = _CELLS(row)
+        if _is_empty_row(cells):
+            continue
+        records.append(parse_listing_row(cells, puan, years, base_url))
+    return records
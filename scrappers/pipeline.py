@@ -0,0 +1,57 @@
+import os
+import threading
+from concurrent.futures import Future
+
+PARSE_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))  # Sayfa ayrıştıran süreç sayısı
+MAX_PENDING = 8  # Ayrıştırılmayı bekleyen en fazla sayfa (sınırlı kuyruk)
+
+
+class PagePipeline:
+    """
+    Tarayıcı iş parçacığının ham sayfa HTML'ini süreç havuzuna verdiği üretici/tüketici hattı.
+    En fazla `max_pending` sayfa beklemede olabilir; dolduğunda tarayıcı bir sayfanın
+    ayrıştırılmasını bekler. Ayrıştırma sonuçları gönderilme sırasıyla `results()` ile alınır,
+    `on_result` verilirse her sonuç hazır olur olmaz (anahtar, sonuç) ile çağrılır.
+    `executor` None ise sayfalar aynı iş parçacığında hemen ayrıştırılır.
+    """
+
+    def __init__(self, executor, parse, max_pending=MAX_PENDING, on_result=None):
+        self.executor = executor
+        self.parse = parse
+        self.on_result = on_result
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._futures = []
+
+    def _done(self, key, future):
+        self._slots.release()
+        if self.on_result is not None and not future.cancelled() and future.exception() is None:
+            try:
+                self.on_result(key, future.result())
+            except Exception as e:
+                print(f"{key} sonucu işlenirken hata oluştu: {e}")
+
+    def submit(self, key, *args):
+        """
+        Sayfayı ayrıştırılmak üzere kuyruğa ekler; kuyruk doluysa yer açılana kadar bekler.
+        """
+        self._slots.acquire()
+        if self.executor is None:
+            future = Future()
+            try:
+                future.set_result(self.parse(*args))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            try:
+                future = self.executor.submit(self.parse, *args)
+            except BaseException:
+                self._slots.release()
+                raise
+        future.add_done_callback(lambda done: self._done(key, done))
+        self._futures.append((key, future))
+
+    def results(self):
+        """
+        Tüm sayfalar ayrıştırılınca (anahtar, sonuç) çiftlerini gönderilme sırasıyla döndürür.
+        """
+        return [(key, future.result()) for key, future in self._futures]
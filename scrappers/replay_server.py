@@ -0,0 +1,71 @@
+import argparse
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from scrappers.http_engine import recording_name
+from scrappers.score_types import get_score_type
+
+
+def make_handler(record_dir):
+    """
+    Kaydedilmiş yanıtları `record_dir` klasöründen sunan istek işleyicisini oluşturur.
+    """
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Bağlantılar gerçek sunucu gibi açık tutulur (keep-alive)
+
+        def _reply(self, params):
+            try:
+                score_key = get_score_type(params["p"][0]).key
+                start = int(params.get("start", ["0"])[0])
+                length = int(params.get("length", ["10"])[0])
+            except (KeyError, ValueError):
+                self.send_error(400, "Eksik parametre")
+                return
+
+            path = os.path.join(record_dir, recording_name(score_key, start, length))
+            if not os.path.exists(path):
+                self.send_error(404, explain=f"Kayıt bulunamadı: {os.path.basename(path)}")
+                return
+
+            with open(path, "rb") as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self._reply(parse_qs(urlsplit(self.path).query))
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            params = parse_qs(urlsplit(self.path).query)
+            params.update(parse_qs(self.rfile.read(length).decode("utf-8")))
+            self._reply(params)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ReplayHandler
+
+
+def serve(record_dir, host="127.0.0.1", port=8765):
+    """
+    Kaydedilmiş yanıtları yerel olarak sunan sunucuyu döndürür (serve_forever ile başlatılır).
+    Port 0 verilirse boş bir port seçilir.
+    """
+    return ThreadingHTTPServer((host, port), make_handler(record_dir))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kaydedilmiş veri kaynağı yanıtlarını yerel olarak sunar.")
+    parser.add_argument("record_dir")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = serve(args.record_dir, port=args.port)
+    print(f"Kayıtlar http://127.0.0.1:{server.server_port}/ adresinden sunuluyor.")
+    server.serve_forever()
@@ -0,0 +1,54 @@
+from collections import namedtuple
+
+# Puan türü ayarları
+# key: kısa ad, puan: çıktıdaki puan etiketi, url: tercih sihirbazı tablo sayfası,
+# data_url: tablonun DataTables veri kaynağı, years: <font> ile verilen yıl sayısı,
+# output: ham Excel çıktısı
+ScoreType = namedtuple("ScoreType", ["key", "puan", "url", "data_url", "years", "output"])
+
+BASE_URL = "https://yokatlas.yok.gov.tr/"
+
+SCORE_TYPES = {
+    "say": ScoreType(
+        "say", "SAY",
+        f"{BASE_URL}tercih-sihirbazi-t4-tablo.php?p=say",
+        f"{BASE_URL}server_processing-atlas2016-TS-t4.php?p=say",
+        4, "data/raw/unis_details_say.xlsx",
+    ),
+    "ea": ScoreType(
+        "ea", "EA",
+        f"{BASE_URL}tercih-sihirbazi-t4-tablo.php?p=ea",
+        f"{BASE_URL}server_processing-atlas2016-TS-t4.php?p=ea",
+        4, "data/raw/unis_details_ea.xlsx",
+    ),
+    "söz": ScoreType(
+        "söz", "SÖZ",
+        f"{BASE_URL}tercih-sihirbazi-t4-tablo.php?p=söz",
+        f"{BASE_URL}server_processing-atlas2016-TS-t4.php?p=söz",
+        4, "data/raw/unis_details_söz.xlsx",
+    ),
+    "dil": ScoreType(
+        "dil", "DİL",
+        f"{BASE_URL}tercih-sihirbazi-t4-tablo.php?p=dil",
+        f"{BASE_URL}server_processing-atlas2016-TS-t4.php?p=dil",
+        4, "data/raw/unis_details_dil.xlsx",
+    ),
+    "tyt": ScoreType(
+        "tyt", "TYT",
+        f"{BASE_URL}tercih-sihirbazi-t3-tablo.php?p=tyt",
+        f"{BASE_URL}server_processing-atlas2016-TS-t3.php?p=tyt",
+        2, "data/raw/unis_details_tyt.xlsx",
+    ),
+}
+
+
+def get_score_type(key):
+    """
+    Kısa ad ya da puan etiketi ile (örn. "ea" veya "EA") puan türü ayarını döndürür.
+    """
+    if key in SCORE_TYPES:
+        return SCORE_TYPES[key]
+    for score_type in SCORE_TYPES.values():
+        if score_type.puan == key or score_type.puan.lower() == key.lower():
+            return score_type
+    raise KeyError(f"Bilinmeyen puan türü: {key}")
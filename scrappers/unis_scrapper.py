@@ -1,4 +1,3 @@
-from bs4 import BeautifulSoup
 from selenium import webdriver
 import pandas as pd
 import time
@@ -7,13 +6,13 @@ from selenium.webdriver.edge.options import Options as eoptions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from lxml import etree
+from lxml import etree, html as lxml_html
+from urllib.parse import urljoin
+from utils.page_cache import PageCache
+from utils.record_sink import RecordSink
+from utils.table_store import write_table
 
-uni_name = []
-sehir=[]
-logo_url = []
-banner_url = []
-type = []
+unis = RecordSink(["Üniversite İsmi", "sehir", "logo", "banner", "üniversite Türü"])
 
 Foptions = foptions()
 Foptions.headless = False
@@ -23,16 +22,36 @@ Eoptions.headless = False
 
 links = ["https://yokatlas.yok.gov.tr/universite.php"]
 
+# True ise sayfa tarayıcı açılmadan önbellekten ayrıştırılır
+REPLAY = False
+cache = PageCache(replay=REPLAY)
+
 
 for link in links:
+    if REPLAY:
+        page = cache.get(link)
+        if page is None:
+            print(f"{link} önbellekte bulunamadı.")
+            continue
+        for item in lxml_html.fromstring(page).xpath('//*[@id="myUl"]/li'):
+            name_var = item.xpath('./div/div[1]/h3')
+            logo = item.xpath('./div/a/img/@src')
+            sehir_var = item.xpath('./div/div[1]/span[2]')
+            type_var = item.xpath('./div/div[1]/span[1]')
+            unis.append({
+                "Üniversite İsmi": name_var[0].text_content().strip() if name_var else None,
+                "sehir": sehir_var[0].text_content().strip() if sehir_var else None,
+                "logo": urljoin(link, logo[0]) if logo else None,
+                "banner": None,
+                "üniversite Türü": type_var[0].text_content().strip() if type_var else None,
+            })
+        continue
+
     driver = webdriver.Firefox(options=Foptions)
     driver.get(link)
     driver.maximize_window()
-    time.sleep(7)
     
-    html = driver.page_source
-    soup = BeautifulSoup(html,"html.parser")
-    WebDriverWait(driver, 5).until(
+    WebDriverWait(driver, 30, poll_frequency=0.1).until(
             EC.presence_of_element_located((By.XPATH, '//*[@id="myUl"]'))
         )
     list = driver.find_element(By.XPATH, ('//*[@id="myUl"]'))
@@ -42,60 +61,43 @@ for link in links:
     length = len(list_items)
     
     html = driver.page_source
-    soup = BeautifulSoup(html,"html.parser")
+    cache.put(link, html)
 
     WebDriverWait(driver, 5).until(
         EC.presence_of_element_located((By.XPATH, '/html/body'))
     )
 
     for x in range(1,length+1):
+        uni_info = {"banner": None}
 
         try:
-            name_var = driver.find_element(By.XPATH,(f'//*[@id="myUl"]/li[{x}]/div/div[1]/h3')).text
-            uni_name.append(name_var)
+            uni_info["Üniversite İsmi"] = driver.find_element(By.XPATH,(f'//*[@id="myUl"]/li[{x}]/div/div[1]/h3')).text
         except:
-            uni_name.append(None)
+            uni_info["Üniversite İsmi"] = None
 
         try:
             WebDriverWait(driver, 5).until(
             EC.presence_of_element_located((By.XPATH, f'//*[@id="myUl"]/li[{x}]/div/a/img'))
         )
-            logo = driver.find_element(By.XPATH,(f'//*[@id="myUl"]/li[{x}]/div/a/img')).get_attribute("src")
-            logo_url.append(logo)
+            uni_info["logo"] = driver.find_element(By.XPATH,(f'//*[@id="myUl"]/li[{x}]/div/a/img')).get_attribute("src")
         except:
-            logo_url.append(None)
+            uni_info["logo"] = None
         
         try:
-            sehir_var = driver.find_element(By.XPATH,(f'//*[@id="myUl"]/li[{x}]/div/div[1]/span[2]')).text
-            sehir.append(sehir_var)
+            uni_info["sehir"] = driver.find_element(By.XPATH,(f'//*[@id="myUl"]/li[{x}]/div/div[1]/span[2]')).text
         except:
-            sehir.append(None)
+            uni_info["sehir"] = None
 
         try:
-            type_var =  driver.find_element(By.XPATH,(f'//*[@id="myUl"]/li[{x}]/div/div[1]/span[1]')).text
-            type.append(type_var)
+            uni_info["üniversite Türü"] = driver.find_element(By.XPATH,(f'//*[@id="myUl"]/li[{x}]/div/div[1]/span[1]')).text
         except:
-            type.append(None)
+            uni_info["üniversite Türü"] = None
 
-        banner_url.append(None)
+        unis.append(uni_info)
     
 
     driver.quit()
 
-uni_list = pd.DataFrame()
-
-uni_list.insert(0,"Üniversite İsmi","")
-uni_list.insert(1,"sehir","")
-uni_list.insert(2,"logo","")
-uni_list.insert(3,"banner","")
-uni_list.insert(4,"üniversite Türü","")
-for uni in range(0,len(uni_name)):
-        uni_info = {"Üniversite İsmi":uni_name[uni],
-                    "sehir": sehir[uni],
-                    "logo": logo_url[uni],
-                    "banner": banner_url[uni],
-                    "üniversite Türü": type[uni]
-                    }
-        uni_list = uni_list.append(uni_info, ignore_index=True)
-
-uni_list.to_excel("data/unis_details.xlsx",index=True,merge_cells=False)
+# DataFrame sadece bir kez, tüm satırlar toplandıktan sonra oluşturulur
+uni_list = unis.to_frame()
+write_table(uni_list, "data/unis_details.xlsx", excel=True, index=True)
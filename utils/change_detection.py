@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+STORE_PATH = "data/fingerprints.sqlite3"
+CHANGES_DIR = "data/changes"
+
+
+def yop_key(value):
+    """
+    YÖP kodunu karşılaştırılabilir stringe çevirir (Excel'den float gelebilir).
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        if value != value:
+            return ""
+        return str(int(value))
+    return str(value).strip()
+
+
+def fingerprint(record, fields=None):
+    """
+    Kaydın (ya da sadece `fields` alanlarının) kararlı özetini döndürür.
+    """
+    if fields is not None:
+        record = {field: record.get(field) for field in fields}
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class ChangeTracker:
+    """
+    Önceki çalışmanın parmak izlerini saklar ve yeni kayıtlarla karşılaştırır.
+    Kayıtlar `kind` (örn. "listing_ea", "department") ve anahtar (YÖP kodu ya da URL)
+    ile tutulur.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        output_dir = os.path.dirname(path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "kind TEXT, key TEXT, hash TEXT, record TEXT, seen_at REAL, PRIMARY KEY (kind, key))"
+        )
+        self._db.commit()
+
+    def previous(self, kind):
+        """
+        Önceki çalışmadaki {anahtar: (özet, kayıt)} eşleşmesini döndürür.
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT key, hash, record FROM fingerprints WHERE kind = ?", (kind,)).fetchall()
+        return {key: (digest, json.loads(record)) for key, digest, record in rows}
+
+    def diff(self, kind, records, key_field="yop", fields=None, full=True):
+        """
+        Kayıtları önceki çalışmayla karşılaştırır. new/changed/removed/unchanged anahtar
+        listelerini ve değişen kayıtların alan farklarını döndürür. `full` kapalıysa
+        kayıtlar kısmi kabul edilir ve kaldırılan kayıtlar hesaplanmaz. Önceki çalışma yoksa rapor
+        `baseline` olarak işaretlenir (tüm kayıtlar ilk kez görüldüğü için "yeni" sayılır).
+        """
+        previous = self.previous(kind)
+        report = {
+            "kind": kind, "generated_at": time.time(), "baseline": not previous,
+            "new": [], "changed": [], "unchanged": [], "removed": [], "fields": {},
+        }
+
+        seen = set()
+        for record in records:
+            key = yop_key(record.get(key_field))
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            record = dict(record, **{key_field: key})
+
+            if key not in previous:
+                report["new"].append(key)
+            elif previous[key][0] != fingerprint(record, fields):
+                report["changed"].append(key)
+                old = previous[key][1]
+                report["fields"][key] = {
+                    field: [old.get(field), record.get(field)]
+                    for field in (fields or record)
+                    if json.dumps(old.get(field), default=str) != json.dumps(record.get(field), default=str)
+                }
+            else:
+                report["unchanged"].append(key)
+
+        if full:
+            report["removed"] = sorted(set(previous) - seen)
+        return report
+
+    def commit(self, kind, records, key_field="yop", fields=None, full=True):
+        """
+        Kayıtların parmak izlerini bir sonraki karşılaştırma için kaydeder. `full` açıksa
+        kayıtlarda olmayan (kaldırılan) anahtarlar silinir, böylece bir sonraki raporda
+        tekrar "kaldırılan" sayılmazlar.
+        """
+        now = time.time()
+        rows = []
+        for record in records:
+            key = yop_key(record.get(key_field))
+            if key:
+                record = dict(record, **{key_field: key})
+                stored = record if fields is None else {field: record.get(field) for field in fields}
+                rows.append((kind, key, fingerprint(record, fields),
+                             json.dumps(stored, ensure_ascii=False, default=str), now))
+        with self._lock:
+            if full:
+                keys = {row[1] for row in rows}
+                stored = self._db.execute("SELECT key FROM fingerprints WHERE kind = ?", (kind,)).fetchall()
+                self._db.executemany(
+                    "DELETE FROM fingerprints WHERE kind = ? AND key = ?",
+                    [(kind, key) for key, in stored if key not in keys],
+                )
+            self._db.executemany("INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?)", rows)
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def write_changes(report, changes_dir=CHANGES_DIR):
+    """
+    Değişiklik raporunu `changes_dir/<kind>.json` dosyasına yazar ve özetini yazdırır.
+    """
+    os.makedirs(changes_dir, exist_ok=True)
+    path = os.path.join(changes_dir, f"{report['kind']}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=4, default=str)
+
+    print(
+        f"[{report['kind']}] {len(report['new'])} yeni, {len(report['changed'])} değişen, "
+        f"{len(report['removed'])} kaldırılan, {len(report['unchanged'])} aynı kayıt -> {path}"
+    )
+    return path
+
+
+def record_changes(kind, records, key_field="yop", fields=None, full=True, tracker=None):
+    """
+    Kayıtları önceki çalışmayla karşılaştırır, raporu yazar ve parmak izlerini günceller.
+    """
+    owned = tracker is None
+    tracker = tracker or ChangeTracker()
+    try:
+        report = tracker.diff(kind, records, key_field, fields, full)
+        write_changes(report)
+        tracker.commit(kind, records, key_field, fields, full)
+    finally:
+        if owned:
+            tracker.close()
+    return report
+
+
+def _load_report(kind, changes_dir=CHANGES_DIR):
+    path = os.path.join(changes_dir, f"{kind}.json")
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    # Eski raporlarda oluşturulma zamanı yoksa dosya zamanı kullanılır
+    report.setdefault("generated_at", os.path.getmtime(path))
+    return report
+
+
+def load_changes(kinds, changes_dir=CHANGES_DIR):
+    """
+    Verilen raporlardaki yeni ve değişen anahtarları tek bir kümede toplar. İlk taramanın
+    (`baseline`) raporları atlanır. Hiç rapor yoksa None döner (değişiklik bilgisi yok,
+    her şey işlenmeli). Raporların ne zaman uygulandığı için bkz. changes_generated_at.
+    """
+    changed = None
+    for kind in kinds:
+        report = _load_report(kind, changes_dir)
+        if report is None or report.get("baseline"):
+            continue
+        changed = (changed or set()) | set(report["new"]) | set(report["changed"])
+    return changed
+
+
+def changes_generated_at(kinds, changes_dir=CHANGES_DIR):
+    """
+    Verilen raporlardan en yenisinin oluşturulma zamanını döndürür; rapor yoksa None.
+    Bu zamandan sonra tamamlanan işler raporu zaten uygulamış sayılır (bkz. WorkQueue.requeue).
+    """
+    reports = [_load_report(kind, changes_dir) for kind in kinds]
+    times = [report["generated_at"] for report in reports if report is not None]
+    return max(times) if times else None
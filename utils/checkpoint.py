@@ -0,0 +1,75 @@
+import json
+import os
+import threading
+
+
+class Checkpoint:
+    """
+    Sadece sona ekleme yapılan JSONL kontrol noktası deposu.
+    Her satır tamamlanmış bir iş birimidir (sayfa ya da bölüm); yazılan satır hemen diske
+    aktarılır, böylece çökme anında en fazla yarım kalan son satır kaybolur.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._checked_tail = False
+        output_dir = os.path.dirname(path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+    def append(self, key, records, **meta):
+        """
+        Tamamlanan bir iş birimini ve kayıtlarını depoya ekler.
+        """
+        line = json.dumps({"key": key, "records": records, **meta}, ensure_ascii=False)
+        with self._lock:
+            if not self._checked_tail:
+                # Önceki çalışmadan yarım kalmış satır varsa yeni satırı ona yapıştırma
+                line = ("\n" if self._has_torn_tail() else "") + line
+                self._checked_tail = True
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _has_torn_tail(self):
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return False
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def entries(self):
+        """
+        Depodaki tüm girdileri yazılma sırasıyla döndürür. Yarım kalmış son satır atlanır.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    print(f"{self.path} içinde yarım kalmış bir satır atlandı.")
+        return entries
+
+    def completed(self):
+        """
+        Tamamlanmış iş birimlerinin anahtarlarını döndürür.
+        """
+        return {entry["key"] for entry in self.entries()}
+
+    def reset(self):
+        """
+        Depoyu siler.
+        """
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self._checked_tail = False
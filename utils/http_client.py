@@ -0,0 +1,134 @@
+import ssl
+import threading
+from importlib.util import find_spec
+
+import httpx
+
+# HTTP/2 için h2, br sıkıştırma için brotli (ya da brotlicffi) kurulu olmalıdır
+HTTP2 = find_spec("h2") is not None
+BROTLI = find_spec("brotli") is not None or find_spec("brotlicffi") is not None
+
+TIMEOUT = httpx.Timeout(30.0, connect=5.0)  # Bağlantı için 5, okuma/yazma için 30 saniye
+MAX_CONNECTIONS = 100  # Sunucu/proxy başına havuzdaki en fazla bağlantı
+MAX_KEEPALIVE = 20  # Açık tutulacak en fazla boşta bağlantı
+KEEPALIVE_EXPIRY = 30.0  # Boşta bağlantının açık tutulacağı süre (saniye)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Accept-Encoding": "gzip, deflate, br" if BROTLI else "gzip, deflate",
+}
+
+# Tüm TLS bağlantılarında paylaşılan bağlam (sertifika deposu bir kez yüklenir)
+SSL_CONTEXT = ssl.create_default_context()
+
+
+def proxy_url(proxy):
+    """
+    "ip:port" biçimindeki proxy için URL döndürür.
+    """
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+class HttpClient:
+    """
+    Sunucu ve proxy başına kalıcı (keep-alive) bağlantı havuzları tutan ortak HTTP istemcisi.
+    Her proxy için ayrı bir httpx.Client açılır, aynı sunucuya giden istekler havuzdaki
+    bağlantıları tekrar kullanır. h2 kuruluysa HTTP/2, brotli kuruluysa br sıkıştırma
+    kullanılır. Açılan ve tekrar kullanılan bağlantı sayıları `stats()` ile okunur.
+    """
+
+    def __init__(self, timeout=TIMEOUT, http2=HTTP2, headers=None, max_connections=MAX_CONNECTIONS):
+        self.timeout = timeout
+        self.http2 = http2
+        self.headers = {**HEADERS, **(headers or {})}
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=MAX_KEEPALIVE,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        self._clients = {}
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.connections = 0
+        self.http2_requests = 0
+
+    def _client(self, proxy=None):
+        with self._lock:
+            client = self._clients.get(proxy)
+            if client is None:
+                client = self._clients[proxy] = httpx.Client(
+                    http2=self.http2,
+                    proxy=proxy_url(proxy) if proxy else None,
+                    timeout=self.timeout,
+                    limits=self.limits,
+                    headers=self.headers,
+                    verify=SSL_CONTEXT,
+                    default_encoding="utf-8",
+                )
+            return client
+
+    def _trace(self, event_name, info):
+        # Yeni TCP bağlantısı açıldığında sayılır; gerisi tekrar kullanılan bağlantıdır
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.connections += 1
+
+    def request(self, method, url, proxy=None, **kwargs):
+        """
+        İsteği `proxy` (yoksa doğrudan) havuzundan gönderir ve httpx yanıtını döndürür.
+        """
+        extensions = {**kwargs.pop("extensions", {}), "trace": self._trace}
+        with self._lock:
+            self.requests += 1
+        response = self._client(proxy).request(method, url, extensions=extensions, **kwargs)
+        if response.http_version == "HTTP/2":
+            with self._lock:
+                self.http2_requests += 1
+        return response
+
+    def get(self, url, proxy=None, **kwargs):
+        return self.request("GET", url, proxy, **kwargs)
+
+    def post(self, url, proxy=None, **kwargs):
+        return self.request("POST", url, proxy, **kwargs)
+
+    def stats(self):
+        """
+        İstek, açılan bağlantı ve bağlantı tekrar kullanım oranı istatistiklerini döndürür.
+        """
+        with self._lock:
+            reused = max(0, self.requests - self.connections)
+            return {
+                "requests": self.requests,
+                "connections": self.connections,
+                "reused": reused,
+                "reuse_ratio": reused / self.requests if self.requests else 0.0,
+                "http2_requests": self.http2_requests,
+                "pools": len(self._clients),
+            }
+
+    def print_stats(self):
+        stats = self.stats()
+        print(
+            f"{stats['requests']} HTTP isteği, {stats['connections']} yeni bağlantı "
+            f"(%{stats['reuse_ratio'] * 100:.0f} tekrar kullanım, {stats['http2_requests']} HTTP/2), "
+            f"{stats['pools']} havuz."
+        )
+
+    def close(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients = {}
+        for client in clients:
+            client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# HTTP ile çeken tüm modüllerin paylaştığı istemci
+CLIENT = HttpClient()
@@ -0,0 +1,129 @@
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_DIR = "data/cache"
+TTL = 7 * 24 * 3600  # Saniye cinsinden önbellek geçerlilik süresi
+
+
+def request_key(url, params=None):
+    """
+    URL ve parametrelerden kararlı bir istek anahtarı üretir.
+    """
+    payload = json.dumps({"url": url, "params": params or {}}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PageCache:
+    """
+    Çekilen sayfaların kalıcı ve sıkıştırılmış önbelleği.
+    Sayfa içerikleri içerik özetine (sha256) göre gzip olarak saklanır; aynı içerik
+    bir kez yazılır. İstek anahtarı (URL + parametreler) SQLite dizininde içerik
+    özetine bağlanır. `replay` açıkken süre kontrolü yapılmaz ve ağa çıkılmaz.
+    """
+
+    def __init__(self, root=CACHE_DIR, ttl=TTL, replay=False):
+        self.root = root
+        self.ttl = ttl
+        self.replay = replay
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(root, "index.sqlite3"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "key TEXT PRIMARY KEY, url TEXT, params TEXT, content_hash TEXT, fetched_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS pages_url ON pages (url)")
+        self._db.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _blob_path(self, content_hash):
+        return os.path.join(self.root, "blobs", content_hash[:2], f"{content_hash}.html.gz")
+
+    def _read_blob(self, content_hash):
+        try:
+            with gzip.open(self._blob_path(content_hash), "rt", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def get(self, url, params=None, max_age=None):
+        """
+        Önbellekteki sayfayı döndürür. Kayıt yoksa ya da süresi dolmuşsa None.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content_hash, fetched_at FROM pages WHERE key = ?", (request_key(url, params),)
+            ).fetchone()
+
+        max_age = self.ttl if max_age is None else max_age
+        if row is None or (not self.replay and time.time() - row[1] > max_age):
+            self.misses += 1
+            return None
+
+        text = self._read_blob(row[0])
+        if text is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def put(self, url, text, params=None):
+        """
+        Sayfayı önbelleğe yazar ve içerik özetini döndürür.
+        """
+        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        path = self._blob_path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages (key, url, params, content_hash, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (request_key(url, params), url, json.dumps(params or {}, sort_keys=True, ensure_ascii=False),
+                 content_hash, time.time()),
+            )
+            self._db.commit()
+        return content_hash
+
+    def fetch(self, url, fetcher, params=None):
+        """
+        Sayfayı önbellekten döndürür; yoksa `fetcher()` ile çekip önbelleğe yazar.
+        Replay modunda önbellekte olmayan sayfa için KeyError fırlatılır.
+        """
+        text = self.get(url, params)
+        if text is not None:
+            return text
+        if self.replay:
+            raise KeyError(f"Önbellekte bulunamadı: {url} {params or ''}")
+        text = fetcher()
+        self.put(url, text, params)
+        return text
+
+    def entries(self, url):
+        """
+        Bir URL için önbellekteki tüm (parametreler, içerik) çiftlerini döndürür.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT params, content_hash FROM pages WHERE url = ? ORDER BY fetched_at", (url,)
+            ).fetchall()
+
+        for params, content_hash in rows:
+            text = self._read_blob(content_hash)
+            if text is not None:
+                yield json.loads(params), text
+
+    def close(self):
+        with self._lock:
+            self._db.close()
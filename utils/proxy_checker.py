@@ -1,14 +1,23 @@
-import requests
-import threading
-import queue
+import argparse
+import asyncio
+import ssl
 import time
-import socket
-from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from utils.http_client import HEADERS, SSL_CONTEXT
+from utils.proxy_health import HEALTH_PATH, ProxyHealth
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 # Test edilecek URL (Google genellikle iyi bir test hedefidir)
 TEST_URL = "https://www.google.com"
-TIMEOUT = 10  # Saniye cinsinden zaman aşımı süresi
-MAX_THREADS = 50  # Maksimum iş parçacığı sayısı
+CONNECT_TIMEOUT = 3  # Proxy'ye TCP bağlantısı için zaman aşımı (saniye)
+READ_TIMEOUT = 10  # Proxy üzerinden yanıt beklemek için zaman aşımı (saniye)
+MAX_CONCURRENCY = 2000  # Aynı anda kontrol edilecek proxy sayısı
+PROXY_FILE = "utils/proxy_list.txt"
 RESULT_FILE = "utils/proxy_valid.txt"  # Sonuçların yazılacağı dosya
 
 # Proxy listesini oku
@@ -16,98 +25,164 @@ def read_proxies(file_path):
     with open(file_path, 'r') as f:
         return [line.strip() for line in f if line.strip()]
 
-# Proxy'nin çalışırlığını kontrol et
-def check_proxy(proxy, result_queue):
-    protocol = "http"
-    if ":" in proxy:
-        ip, port = proxy.split(":")
-        
-        # HTTP protokolü için kontrol et
-        proxy_dict = {
-            "http": f"http://{proxy}",
-            "https": f"http://{proxy}"
-        }
-        
-        try:
-            # Bağlantı denemesi
-            start_time = time.time()
-            response = requests.get(TEST_URL, proxies=proxy_dict, timeout=TIMEOUT)
-            elapsed_time = time.time() - start_time
-            
-            # Başarılı yanıt aldık mı?
-            if response.status_code == 200:
-                print(f"[+] {proxy} - Çalışıyor! Yanıt süresi: {elapsed_time:.2f}s")
-                result_queue.put((proxy, elapsed_time))
-                return True
-            else:
-                print(f"[-] {proxy} - Yanıt kodu: {response.status_code}")
-                return False
-                
-        except requests.exceptions.RequestException as e:
-            print(f"[-] {proxy} - Hata: {str(e)}")
-            return False
-        except Exception as e:
-            print(f"[-] {proxy} - Beklenmeyen hata: {str(e)}")
-            return False
-    return False
-
-# İş parçacığı fonksiyonu
-def worker(proxy_queue, result_queue):
-    while not proxy_queue.empty():
-        try:
-            proxy = proxy_queue.get(block=False)
-            check_proxy(proxy, result_queue)
-        except queue.Empty:
-            break
-        finally:
-            proxy_queue.task_done()
+# Açık dosya sınırını eşzamanlılığa yetecek kadar yükselt (destekleniyorsa)
+def raise_open_file_limit(concurrency):
+    if resource is None:
+        return
+    try:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        wanted = concurrency + 256
+        if soft != resource.RLIM_INFINITY and soft < wanted:
+            limit = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+    except (ValueError, OSError) as e:
+        print(f"Açık dosya sınırı yükseltilemedi: {e}")
+
+# Yanıtın durum satırından HTTP kodunu oku
+async def read_status(reader, read_timeout):
+    line = await asyncio.wait_for(reader.readline(), read_timeout)
+    parts = line.decode("latin-1").split()
+    if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+        raise ValueError(f"Geçersiz yanıt: {line[:60]!r}")
+    return int(parts[1])
+
+# Başlıkları boş satıra kadar atla
+async def skip_headers(reader, read_timeout):
+    while True:
+        line = await asyncio.wait_for(reader.readline(), read_timeout)
+        if line in (b"\r\n", b"\n", b""):
+            return
+
+# Proxy'yi kontrol et: önce ucuz TCP bağlantısı, ardından aynı bağlantı üzerinden HTTP denemesi.
+# TLS için ortak SSL bağlamı kullanılır, sertifika deposu her kontrolde tekrar yüklenmez.
+# (proxy, durum, süre, hata) döner; durum "ok", "dead" (TCP başarısız) ya da "bad" olur.
+async def check_proxy(proxy, test_url=TEST_URL, connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT,
+                      ssl_context=None):
+    if ":" not in proxy:
+        return proxy, "bad", None, "Geçersiz adres"
+    ip, port = proxy.rsplit(":", 1)
+    target = urlsplit(test_url)
+    host = target.hostname
+    path = target.path or "/"
+    if target.query:
+        path = f"{path}?{target.query}"
+
+    start_time = time.time()
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(ip, int(port)), connect_timeout)
+    except (OSError, asyncio.TimeoutError, ValueError) as e:
+        return proxy, "dead", None, str(e) or type(e).__name__
+
+    try:
+        if target.scheme == "https":
+            target_port = target.port or 443
+            writer.write(f"CONNECT {host}:{target_port} HTTP/1.1\r\nHost: {host}:{target_port}\r\n\r\n".encode())
+            await writer.drain()
+            status = await read_status(reader, read_timeout)
+            if status != 200:
+                return proxy, "bad", None, f"CONNECT yanıt kodu: {status}"
+            await skip_headers(reader, read_timeout)
+            await asyncio.wait_for(
+                writer.start_tls(ssl_context or SSL_CONTEXT, server_hostname=host), read_timeout
+            )
+            request_target = path
+        else:
+            request_target = test_url
+
+        writer.write(
+            f"GET {request_target} HTTP/1.1\r\nHost: {target.netloc}\r\n"
+            f"User-Agent: {HEADERS['User-Agent']}\r\nConnection: close\r\n\r\n".encode()
+        )
+        await writer.drain()
+        status = await read_status(reader, read_timeout)
+        elapsed_time = time.time() - start_time
+        if status == 200:
+            return proxy, "ok", elapsed_time, None
+        return proxy, "bad", None, f"Yanıt kodu: {status}"
+    except (OSError, asyncio.TimeoutError, ValueError, ssl.SSLError) as e:
+        return proxy, "bad", None, str(e) or type(e).__name__
+    finally:
+        writer.close()
+
+# Tüm proxy'leri sınırlı eşzamanlılıkla kontrol et, çalışanları geldikçe dosyaya yaz
+async def check_all(proxies, result_file=RESULT_FILE, test_url=TEST_URL, concurrency=MAX_CONCURRENCY,
+                    connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT, ssl_context=None, verbose=True,
+                    health=None):
+    semaphore = asyncio.Semaphore(concurrency)
+    counts = {"ok": 0, "dead": 0, "bad": 0}
+    valid_proxies = []
+
+    async def limited(proxy):
+        async with semaphore:
+            return await check_proxy(proxy, test_url, connect_timeout, read_timeout, ssl_context)
+
+    # Geçmiş tutuluyorsa tekrar kontrol edilmeyen proxy'ler dosyada kalsın, sonradan sıralanır
+    with open(result_file, 'a' if health is not None else 'w') as f:
+        tasks = [asyncio.ensure_future(limited(proxy)) for proxy in proxies]
+        for task in asyncio.as_completed(tasks):
+            proxy, state, elapsed_time, error = await task
+            counts[state] += 1
+            if health is not None:
+                health.record(proxy, state == "ok", elapsed_time, commit=False)
+                if sum(counts.values()) % 100 == 0:
+                    health.flush()
+            if state == "ok":
+                valid_proxies.append((proxy, elapsed_time))
+                f.write(f"{proxy}\n")
+                f.flush()
+                if verbose:
+                    print(f"[+] {proxy} - Çalışıyor! Yanıt süresi: {elapsed_time:.2f}s")
+            elif verbose and state == "bad":
+                print(f"[-] {proxy} - Hata: {error}")
+
+    if health is not None:
+        health.flush()
+    print(f"{counts['dead']} proxy TCP bağlantısında, {counts['bad']} proxy HTTP denemesinde elendi.")
+    return valid_proxies
 
 # Ana fonksiyon
 def main():
+    parser = argparse.ArgumentParser(description="Proxy listesini asyncio ile kontrol eder.")
+    parser.add_argument("--input", default=PROXY_FILE, help="Proxy listesi dosyası")
+    parser.add_argument("--output", default=RESULT_FILE, help="Çalışan proxy'lerin yazılacağı dosya")
+    parser.add_argument("--test-url", default=TEST_URL, help="Proxy üzerinden istenecek adres")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="Aynı anda kontrol sayısı")
+    parser.add_argument("--connect-timeout", type=float, default=CONNECT_TIMEOUT, help="TCP bağlantı zaman aşımı")
+    parser.add_argument("--read-timeout", type=float, default=READ_TIMEOUT, help="Yanıt zaman aşımı")
+    parser.add_argument("--quiet", action="store_true", help="Proxy başına satır yazdırma")
+    parser.add_argument("--health", default=HEALTH_PATH, help="Proxy geçmişinin tutulduğu SQLite dosyası")
+    parser.add_argument("--full", action="store_true",
+                        help="Geçmişe bakmadan tüm listeyi tekrar kontrol et")
+    args = parser.parse_args()
+
     start_time = time.time()
-    
+
     # Proxy listesini oku
-    proxies = read_proxies("utils/proxy_list.txt")
-    print(f"Toplam {len(proxies)} proxy kontrol edilecek.")
-    
-    # Kuyrukları oluştur
-    proxy_queue = queue.Queue()
-    result_queue = queue.Queue()
-    
-    # Proxy'leri kuyruğa ekle
-    for proxy in proxies:
-        proxy_queue.put(proxy)
-    
-    # İş parçacıklarını oluştur ve başlat
-    threads = []
-    thread_count = min(MAX_THREADS, len(proxies))
-    
-    print(f"{thread_count} iş parçacığı başlatılıyor...")
-    for _ in range(thread_count):
-        thread = threading.Thread(target=worker, args=(proxy_queue, result_queue))
-        thread.daemon = True
-        thread.start()
-        threads.append(thread)
-    
-    # Tüm iş parçacıklarının bitmesini bekle
-    for thread in threads:
-        thread.join()
-    
-    # Sonuçları topla
+    proxies = read_proxies(args.input)
+    health = ProxyHealth(args.health)
+    # Sadece süresi geçmiş, kararsız ya da yeni proxy'leri kontrol et
+    to_check = proxies if args.full else health.due(proxies)
+    print(f"Toplam {len(proxies)} proxy'den {len(to_check)} tanesi kontrol edilecek.")
+
     valid_proxies = []
-    while not result_queue.empty():
-        proxy, _ = result_queue.get()
-        valid_proxies.append(proxy)
-    
-    # Sonuçları dosyaya yaz
-    with open(RESULT_FILE, 'w') as f:
-        for proxy in valid_proxies:
-            f.write(f"{proxy}\n")
-    
+    if to_check:
+        concurrency = max(1, min(args.concurrency, len(to_check)))
+        raise_open_file_limit(concurrency)
+        print(f"En fazla {concurrency} eşzamanlı kontrol yapılıyor...")
+
+        valid_proxies = asyncio.run(check_all(
+            to_check, args.output, args.test_url, concurrency, args.connect_timeout, args.read_timeout,
+            verbose=not args.quiet, health=health,
+        ))
+
+    # Kontrol sırasında gelen sırayla yazılan dosyayı gecikmeye göre sıralı listeyle değiştir
+    ranked_count = health.write_ranked(args.output, proxies)
+    health.close()
+
     elapsed_time = time.time() - start_time
-    print(f"\nTamamlandı! {len(valid_proxies)} geçerli proxy bulundu.")
-    print(f"Geçerli proxy'ler '{RESULT_FILE}' dosyasına kaydedildi.")
+    print(f"\nTamamlandı! Bu çalışmada {len(valid_proxies)} geçerli proxy bulundu.")
+    print(f"En hızlıdan yavaşa sıralı {ranked_count} proxy '{args.output}' dosyasına kaydedildi.")
     print(f"Toplam süre: {elapsed_time:.2f} saniye")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
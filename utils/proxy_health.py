@@ -0,0 +1,146 @@
+import os
+import sqlite3
+import threading
+import time
+
+HEALTH_PATH = "utils/proxy_health.sqlite3"
+EWMA_ALPHA = 0.3  # Yeni gecikme ölçümünün ortalamadaki ağırlığı
+STALE_AFTER = 6 * 3600  # Sağlıklı proxy'ler bu süreden sonra tekrar kontrol edilir (saniye)
+BORDERLINE_AFTER = 30 * 60  # Kararsız proxy'ler daha sık kontrol edilir (saniye)
+DEAD_AFTER = 24 * 3600  # Art arda başarısız olan proxy'ler nadiren kontrol edilir (saniye)
+RETIRE_AFTER = 3  # Bu kadar art arda başarısızlıktan sonra proxy ölü sayılır
+MIN_CHECKS = 3  # Başarı oranına güvenmek için gereken en az kontrol sayısı
+BORDERLINE_RATE = 0.8  # Bu oranın altındaki proxy'ler kararsız sayılır
+
+
+class ProxyHealth:
+    """
+    Proxy kontrol geçmişinin kalıcı deposu.
+    Her proxy için kontrol ve başarı sayısı, üstel hareketli ortalama (EWMA) gecikme,
+    son kontrol ve son başarılı görülme zamanı SQLite'ta tutulur.
+    """
+
+    def __init__(self, path=HEALTH_PATH, alpha=EWMA_ALPHA):
+        output_dir = os.path.dirname(path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS proxies ("
+            "proxy TEXT PRIMARY KEY, checks INTEGER, successes INTEGER, failures_in_row INTEGER, "
+            "latency REAL, last_checked REAL, last_seen REAL)"
+        )
+        self._db.commit()
+
+    def record(self, proxy, ok, latency=None, commit=True):
+        """
+        Bir kontrol sonucunu proxy geçmişine ekler. Başarılı kontrollerde gecikme
+        EWMA ile ortalamaya katılır.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT checks, successes, failures_in_row, latency, last_seen FROM proxies WHERE proxy = ?", (proxy,)
+            ).fetchone()
+            checks, successes, failures_in_row, average, last_seen = row or (0, 0, 0, None, None)
+
+            checks += 1
+            if ok:
+                successes += 1
+                failures_in_row = 0
+                last_seen = now
+                if latency is not None:
+                    average = latency if average is None else self.alpha * latency + (1 - self.alpha) * average
+            else:
+                failures_in_row += 1
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO proxies VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (proxy, checks, successes, failures_in_row, average, now, last_seen),
+            )
+            if commit:
+                self._db.commit()
+
+    def flush(self):
+        with self._lock:
+            self._db.commit()
+
+    def stats(self, proxy):
+        """
+        Proxy'nin geçmişini sözlük olarak döndürür. Kayıt yoksa None.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT checks, successes, failures_in_row, latency, last_checked, last_seen "
+                "FROM proxies WHERE proxy = ?", (proxy,)
+            ).fetchone()
+        if row is None:
+            return None
+        checks, successes, failures_in_row, latency, last_checked, last_seen = row
+        return {
+            "checks": checks,
+            "success_rate": successes / checks if checks else 0.0,
+            "failures_in_row": failures_in_row,
+            "latency": latency,
+            "last_checked": last_checked,
+            "last_seen": last_seen,
+        }
+
+    def due(self, proxies, now=None):
+        """
+        Tekrar kontrol edilmesi gereken proxy'leri döndürür: hiç kontrol edilmemiş,
+        süresi geçmiş ya da kararsız (düşük başarı oranı / az kontrol) olanlar.
+        Ölü sayılan proxy'ler sadece DEAD_AFTER süresi dolunca tekrar denenir.
+        """
+        now = time.time() if now is None else now
+        due = []
+        for proxy in proxies:
+            stats = self.stats(proxy)
+            if stats is None:
+                due.append(proxy)
+                continue
+
+            age = now - stats["last_checked"]
+            if stats["failures_in_row"] >= RETIRE_AFTER:
+                max_age = DEAD_AFTER
+            elif stats["failures_in_row"] > 0 or stats["checks"] < MIN_CHECKS \
+                    or stats["success_rate"] < BORDERLINE_RATE:
+                max_age = BORDERLINE_AFTER
+            else:
+                max_age = STALE_AFTER
+            if age >= max_age:
+                due.append(proxy)
+        return due
+
+    def ranked(self, proxies=None):
+        """
+        Son kontrolü başarılı olan proxy'leri EWMA gecikmesine göre (en hızlı önce)
+        sıralı olarak [(proxy, gecikme, başarı oranı)] şeklinde döndürür.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT proxy, latency, CAST(successes AS REAL) / checks FROM proxies "
+                "WHERE failures_in_row = 0 AND latency IS NOT NULL ORDER BY latency"
+            ).fetchall()
+        if proxies is not None:
+            proxies = set(proxies)
+            rows = [row for row in rows if row[0] in proxies]
+        return rows
+
+    def write_ranked(self, result_file, proxies=None):
+        """
+        Sıralı proxy listesini `result_file` dosyasına yazar ve yazılan sayıyı döndürür.
+        """
+        ranked = self.ranked(proxies)
+        tmp_path = f"{result_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            for proxy, _, _ in ranked:
+                f.write(f"{proxy}\n")
+        os.replace(tmp_path, result_file)
+        return len(ranked)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,128 @@
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from utils.proxy_checker import RESULT_FILE, read_proxies
+from utils.proxy_health import EWMA_ALPHA, HEALTH_PATH, ProxyHealth
+
+MAX_PER_PROXY = 2  # Bir proxy üzerinden aynı anda yapılabilecek en fazla istek / açık tarayıcı
+MAX_FAILURES = 3  # Bu kadar art arda başarısızlıktan sonra proxy kullanımdan çıkarılır
+DEFAULT_LATENCY = 1.0  # Gecikmesi bilinmeyen proxy'ler için varsayılan (saniye)
+
+
+class ProxyPool:
+    """
+    Doğrulanmış proxy'ler arasında istekleri dağıtan zamanlayıcı.
+    Proxy'ler ölçülen gecikmeye göre ağırlıklı seçilir (hızlı olan daha sık), her proxy
+    için aynı anda en fazla `max_per_proxy` iş verilir ve art arda `max_failures` kez
+    başarısız olan proxy çalışma sırasında kullanımdan çıkarılır.
+    """
+
+    def __init__(self, proxies, latencies=None, max_per_proxy=MAX_PER_PROXY, max_failures=MAX_FAILURES,
+                 health=None):
+        latencies = latencies or {}
+        self.max_per_proxy = max_per_proxy
+        self.max_failures = max_failures
+        self.health = health
+
+        self._latency = {proxy: latencies.get(proxy) or DEFAULT_LATENCY for proxy in proxies}
+        self._in_flight = {proxy: 0 for proxy in proxies}
+        self._failures = {proxy: 0 for proxy in proxies}
+        self._retired = set()
+        self._condition = threading.Condition()
+
+        self.requests = 0
+        self.failures = 0
+
+    @classmethod
+    def from_file(cls, path=RESULT_FILE, health_path=HEALTH_PATH, **kwargs):
+        """
+        `proxy_valid.txt` dosyasından havuz oluşturur. Proxy geçmişi varsa gecikmeler
+        oradan alınır ve havuzdaki sonuçlar geçmişe yazılır.
+        """
+        proxies = read_proxies(path)
+        health = ProxyHealth(health_path) if os.path.exists(health_path) else None
+        latencies = {}
+        if health is not None:
+            latencies = {proxy: latency for proxy, latency, _ in health.ranked(proxies)}
+        print(f"{len(proxies)} proxy yüklendi ({path}).")
+        return cls(proxies, latencies, health=health, **kwargs)
+
+    def active(self):
+        """
+        Kullanımdan çıkarılmamış proxy'leri döndürür.
+        """
+        with self._condition:
+            return [proxy for proxy in self._latency if proxy not in self._retired]
+
+    def capacity(self):
+        """
+        Aynı anda yapılabilecek toplam iş sayısını döndürür.
+        """
+        return len(self.active()) * self.max_per_proxy
+
+    def acquire(self, timeout=None):
+        """
+        Boş kapasitesi olan bir proxy seçer; gecikmesi düşük olan daha olasıdır.
+        Tüm proxy'ler doluysa biri boşalana kadar bekler.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._condition:
+            while True:
+                if len(self._retired) == len(self._latency):
+                    raise RuntimeError("Kullanılabilir proxy kalmadı.")
+                available = [
+                    proxy for proxy, count in self._in_flight.items()
+                    if count < self.max_per_proxy and proxy not in self._retired
+                ]
+                if available:
+                    weights = [1.0 / max(self._latency[proxy], 0.01) for proxy in available]
+                    proxy = random.choices(available, weights)[0]
+                    self._in_flight[proxy] += 1
+                    self.requests += 1
+                    return proxy
+
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Boş proxy beklenirken zaman aşımı oluştu.")
+                self._condition.wait(remaining)
+
+    def release(self, proxy, ok=True, latency=None):
+        """
+        Proxy'yi geri verir ve sonucunu işler. Başarılı isteklerin gecikmesi EWMA ile
+        ortalamaya katılır; art arda başarısızlıklar sınırı aşınca proxy çıkarılır.
+        """
+        with self._condition:
+            self._in_flight[proxy] -= 1
+            if ok:
+                self._failures[proxy] = 0
+                if latency is not None:
+                    self._latency[proxy] = EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * self._latency[proxy]
+            else:
+                self.failures += 1
+                self._failures[proxy] += 1
+                if self._failures[proxy] >= self.max_failures and proxy not in self._retired:
+                    self._retired.add(proxy)
+                    print(f"[-] {proxy} art arda {self._failures[proxy]} kez başarısız oldu, çıkarıldı.")
+            self._condition.notify_all()
+
+        if self.health is not None:
+            self.health.record(proxy, ok, latency)
+
+    @contextmanager
+    def proxy(self, timeout=None):
+        """
+        `with pool.proxy() as proxy:` biçiminde kullanım için proxy sağlar.
+        Blok hata fırlatırsa proxy başarısız sayılır.
+        """
+        proxy = self.acquire(timeout)
+        start_time = time.time()
+        try:
+            yield proxy
+        except BaseException:
+            self.release(proxy, ok=False)
+            raise
+        else:
+            self.release(proxy, ok=True, latency=time.time() - start_time)
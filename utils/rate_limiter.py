@@ -0,0 +1,162 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+INITIAL_RATE = 2.0  # Başlangıç hızı (istek/saniye)
+MIN_RATE = 0.2  # En düşük hız (istek/saniye)
+MAX_RATE = 20.0  # En yüksek hız (istek/saniye)
+BURST = 2  # Kovada biriktirilebilecek en fazla istek hakkı
+INCREASE = 0.1  # Başarılı istek başına hıza eklenen miktar (toplamsal artış)
+DECREASE = 0.5  # Yavaşlama ya da engellemede hızın çarpıldığı oran (çarpımsal azalış)
+BACKOFF = 2.0  # Engellemeden sonra ilk bekleme süresi (saniye), art arda her seferde ikiye katlanır
+MAX_BACKOFF = 60.0  # En uzun bekleme süresi (saniye)
+SLOW_FACTOR = 3.0  # Ortalama gecikmenin bu katından yavaş yanıtlar yavaşlama sayılır
+LATENCY_ALPHA = 0.2  # Gecikme ortalamasında yeni ölçümün ağırlığı
+THROTTLE_STATUSES = {429, 500, 502, 503, 504}
+EMPTY_TABLE_TEXT = "Tabloda herhangi bir veri mevcut değil"
+
+
+def limiter_key(url, proxy=None):
+    """
+    Hız sınırının tutulduğu anahtarı döndürür: sunucu ve (varsa) proxy.
+    Her proxy ayrı bir çıkış IP'si olduğu için kendi kovasına sahiptir.
+    """
+    host = urlsplit(url).netloc or url
+    return f"{host}|{proxy}" if proxy else host
+
+
+def throttle_reason(status=None, text=None, latency=None, baseline=None):
+    """
+    Yanıtın yavaşlatma/engelleme işareti olup olmadığını döndürür.
+    "status", "empty" ve "slow" nedenlerinden biri ya da None.
+    """
+    if status is not None and status in THROTTLE_STATUSES:
+        return "status"
+    if text is not None and EMPTY_TABLE_TEXT in text:
+        return "empty"
+    if latency is not None and baseline is not None and latency > SLOW_FACTOR * baseline:
+        return "slow"
+    return None
+
+
+class _Bucket:
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.strikes = 0
+        self.latency = None
+
+
+class RateLimiter:
+    """
+    Anahtar (sunucu / proxy) başına jeton kovası ile çalışan uyarlamalı hız sınırlayıcı.
+    Her başarılı istekte hız sabit miktarda artar; 429/5xx, boş tablo sayfası ya da
+    belirgin yavaşlama görülünce hız yarıya iner (AIMD). Engelleme durumunda ayrıca
+    rastgele sapmalı (jitter) ve art arda ikiye katlanan bir bekleme uygulanır.
+    """
+
+    def __init__(self, rate=INITIAL_RATE, min_rate=MIN_RATE, max_rate=MAX_RATE, burst=BURST):
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = INCREASE
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+        self.throttles = 0
+        self.waited = 0.0
+
+    def _bucket(self, key):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.initial_rate)
+        return bucket
+
+    def wait(self, key):
+        """
+        Anahtar için istek hakkı doğana kadar bekler ve beklenen süreyi döndürür.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                bucket = self._bucket(key)
+                now = time.monotonic()
+                bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+                bucket.updated = now
+
+                if now < bucket.blocked_until:
+                    delay = bucket.blocked_until - now
+                elif bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    self.waited += waited
+                    return waited
+                else:
+                    delay = (1 - bucket.tokens) / bucket.rate
+            time.sleep(delay)
+            waited += delay
+
+    def report(self, key, status=None, text=None, latency=None):
+        """
+        İsteğin sonucunu işler ve varsa yavaşlatma nedenini döndürür.
+        """
+        with self._lock:
+            baseline = self._bucket(key).latency
+        reason = throttle_reason(status, text, latency, baseline)
+        if reason is None:
+            self.success(key, latency)
+        else:
+            self.throttled(key, reason)
+        return reason
+
+    def success(self, key, latency=None):
+        with self._lock:
+            bucket = self._bucket(key)
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+            bucket.strikes = 0
+            if latency is not None:
+                bucket.latency = latency if bucket.latency is None else \
+                    LATENCY_ALPHA * latency + (1 - LATENCY_ALPHA) * bucket.latency
+
+    def throttled(self, key, reason="status"):
+        """
+        Hızı düşürür; yavaşlama dışındaki nedenlerde anahtarı bir süre bekletir.
+        """
+        with self._lock:
+            bucket = self._bucket(key)
+            bucket.rate = max(self.min_rate, bucket.rate * DECREASE)
+            bucket.tokens = 0.0
+            self.throttles += 1
+            if reason == "slow":
+                delay = 0.0
+            else:
+                bucket.strikes += 1
+                delay = min(MAX_BACKOFF, BACKOFF * 2 ** (bucket.strikes - 1)) * random.uniform(0.5, 1.5)
+                bucket.blocked_until = time.monotonic() + delay
+            rate = bucket.rate
+        print(f"[{key}] yavaşlatma işareti ({reason}): hız {rate:.2f} istek/sn, {delay:.1f} sn bekleniyor.")
+
+    def split(self, parts):
+        """
+        Hız sınırlarını (başlangıç, en düşük, en yüksek hız ve artış miktarı) `parts` süreç
+        arasında paylaştırır; aynı sunucuya giden toplam hız tek süreçteki sınırları aşmaz.
+        """
+        parts = max(1, parts)
+        with self._lock:
+            self.initial_rate /= parts
+            self.min_rate /= parts
+            self.max_rate /= parts
+            self.increase /= parts
+            for bucket in self._buckets.values():
+                bucket.rate /= parts
+
+    def rate(self, key):
+        with self._lock:
+            return self._bucket(key).rate
+
+
+# Tüm scraperların paylaştığı sınırlayıcı
+LIMITER = RateLimiter()
@@ -0,0 +1,35 @@
+import pandas as pd
+
+
+class RecordSink:
+    """
+    Satırları sütun listelerinde biriktiren kayıt deposu.
+    Her satır eklemesi sabit süreli (liste sonuna ekleme) olur; DataFrame sadece
+    `to_frame()` çağrıldığında bir kez oluşturulur.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self._data = {column: [] for column in self.columns}
+        self._count = 0
+
+    def append(self, record):
+        """
+        Tek bir kaydı (sözlük) ekler. Eksik sütunlar boş bırakılır, fazlası yok sayılır.
+        """
+        for column in self.columns:
+            self._data[column].append(record.get(column))
+        self._count += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def __len__(self):
+        return self._count
+
+    def to_frame(self):
+        """
+        Biriken kayıtlardan DataFrame oluşturur.
+        """
+        return pd.DataFrame(self._data, columns=self.columns)
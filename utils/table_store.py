@@ -0,0 +1,219 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+from importlib.util import find_spec
+
+import pandas as pd
+
+# Parquet için pyarrow gerekir; yoksa tablolar eskisi gibi Excel'e yazılır
+PARQUET = find_spec("pyarrow") is not None
+COMPRESSION = "zstd"  # Parquet sıkıştırma yöntemi
+CACHE_DIR = ".table_cache"  # Çözülmüş Excel tablolarının tutulduğu klasör (her Excel dosyasının yanında)
+
+
+def parquet_path(path):
+    """
+    Tablo yolunun (.xlsx ya da .parquet) Parquet karşılığını döndürür.
+    """
+    return os.path.splitext(path)[0] + ".parquet"
+
+
+def excel_path(path):
+    """
+    Tablo yolunun (.xlsx ya da .parquet) Excel karşılığını döndürür.
+    """
+    return os.path.splitext(path)[0] + ".xlsx"
+
+
+def table_exists(path):
+    return os.path.exists(parquet_path(path)) or os.path.exists(excel_path(path))
+
+
+def _newest(path):
+    """
+    Okunacak kopyayı döndürür: Parquet dosyası Excel'den eski değilse Parquet, değilse Excel.
+    Excel elle düzenlenip kaydedilirse daha yeni olduğu için o okunur.
+    """
+    parquet, excel = parquet_path(path), excel_path(path)
+    if PARQUET and os.path.exists(parquet):
+        if not os.path.exists(excel) or os.path.getmtime(parquet) >= os.path.getmtime(excel):
+            return parquet
+    return excel
+
+
+def _arrow_safe(df):
+    """
+    Arrow'a çevrilemeyen karışık tipli (örn. hem metin hem sayı) sütunlardaki değerleri metne çevirir.
+    Liste hücreleri liste olarak kalır.
+    """
+    import pyarrow as pa
+
+    df = df.copy()
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        try:
+            pa.array(df[column], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            df[column] = df[column].map(
+                lambda value: value if value is None or isinstance(value, (list, str)) or value != value else str(value)
+            )
+    return df
+
+
+def _match_mtime(path):
+    # Aynı içerikli Excel kopyası Parquet'ten yeni görünmesin; elle düzenlenirse yeni sayılır
+    parquet, excel = parquet_path(path), excel_path(path)
+    if os.path.exists(parquet) and os.path.exists(excel):
+        mtime = os.path.getmtime(parquet)
+        os.utime(excel, (mtime, mtime))
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_paths(source):
+    """
+    Excel dosyasının çözülmüş kopyasının (.parquet) ve üst verisinin (.json) yollarını döndürür.
+    """
+    name = os.path.basename(source)
+    cache_dir = os.path.join(os.path.dirname(source), CACHE_DIR)
+    return os.path.join(cache_dir, f"{name}.parquet"), os.path.join(cache_dir, f"{name}.json")
+
+
+def _cached_excel(source):
+    """
+    Excel dosyasının önbellekteki çözülmüş kopyasının yolunu döndürür; kopya yoksa ya da dosya
+    değiştiyse Excel bir kez okunup önbelleğe yazılır. Boyut ve değiştirilme zamanı aynıysa dosya
+    okunmaz; farklıysa içerik özeti karşılaştırılır, içerik aynıysa kopya kullanılmaya devam eder.
+    """
+    cached, meta_path = cache_paths(source)
+    stat = os.stat(source)
+    meta = None
+    if os.path.exists(cached) and os.path.exists(meta_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = None
+
+    if meta and meta.get("size") == stat.st_size and meta.get("mtime_ns") == stat.st_mtime_ns:
+        return cached
+
+    digest = _file_hash(source)
+    if not meta or meta.get("sha256") != digest:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        temp = f"{cached}.{os.getpid()}.tmp"
+        _arrow_safe(pd.read_excel(source)).to_parquet(temp, index=False, compression=COMPRESSION)
+        os.replace(temp, cached)
+
+    meta = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+    temp = f"{meta_path}.{os.getpid()}.tmp"
+    with open(temp, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(temp, meta_path)
+    return cached
+
+
+def write_table(df, path, excel=False, index=False):
+    """
+    Tabloyu `path` yanındaki sıkıştırılmış .parquet dosyasına yazar. Liste sütunları liste olarak
+    saklanır. `excel` açıksa ya da pyarrow kurulu değilse .xlsx kopyası da yazılır.
+    """
+    output_dir = os.path.dirname(path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    if PARQUET:
+        _arrow_safe(df).to_parquet(parquet_path(path), index=False, compression=COMPRESSION)
+    if excel or not PARQUET:
+        df.to_excel(excel_path(path), index=index, merge_cells=False)
+        _match_mtime(path)
+
+
+def read_table(path, columns=None, cache=True):
+    """
+    Tablonun en güncel kopyasını okur (bkz. _newest). `columns` verilirse sadece bu sütunlar
+    okunur; tabloda olmayan sütunlar atlanır. Parquet'teki liste sütunları Python listesi olarak döner.
+    Excel okunacaksa `cache` açıkken çözülmüş kopyası önbellekten okunur (bkz. _cached_excel).
+    """
+    source = _newest(path)
+    if source.endswith(".xlsx"):
+        if PARQUET and cache:
+            source = _cached_excel(source)
+        elif columns is None:
+            return pd.read_excel(source)
+        else:
+            wanted = set(columns)
+            return pd.read_excel(source, usecols=lambda column: column in wanted)
+
+    import pyarrow.parquet as pq
+    import pyarrow.types as pa_types
+
+    if columns is not None:
+        names = set(pq.read_schema(source).names)
+        columns = [column for column in columns if column in names]
+    table = pq.read_table(source, columns=columns)
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa_types.is_list(field.type) or pa_types.is_large_list(field.type):
+            df[field.name] = pd.Series(table.column(field.name).to_pylist(), index=df.index, dtype=object)
+    return df
+
+
+def export_excel(path, output=None):
+    """
+    Parquet tablosunun Excel kopyasını yazar (liste hücreleri metin olarak). Yazılan yolu döndürür.
+    """
+    output = output or excel_path(path)
+    read_table(parquet_path(path)).to_excel(output, index=False, merge_cells=False)
+    if output == excel_path(path):
+        _match_mtime(path)
+    return output
+
+
+def convert(path):
+    """
+    Excel tablosunu Parquet'e çevirir. Yazılan yolu döndürür.
+    """
+    df = pd.read_excel(excel_path(path))
+    write_table(df, path)
+    return parquet_path(path)
+
+
+def _expand(paths, extension):
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(glob.glob(os.path.join(path, "**", f"*{extension}"), recursive=True))
+        else:
+            yield path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ara tabloları Parquet ve Excel arasında çevirir.")
+    parser.add_argument("command", choices=["convert", "export"],
+                        help="convert: .xlsx -> .parquet, export: .parquet -> .xlsx")
+    parser.add_argument("paths", nargs="+", help="Tablo dosyaları ya da klasörler")
+    args = parser.parse_args()
+
+    if not PARQUET:
+        parser.error("Parquet için pyarrow kurulu olmalı (pip install pyarrow).")
+
+    extension = ".xlsx" if args.command == "convert" else ".parquet"
+    for path in _expand(args.paths, extension):
+        try:
+            output = convert(path) if args.command == "convert" else export_excel(path)
+            print(f"{path} -> {output}")
+        except Exception as e:
+            print(f"{path} çevrilemedi: {e}")
+
+
+if __name__ == "__main__":
+    main()
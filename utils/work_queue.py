@@ -0,0 +1,196 @@
+import glob
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from utils.change_detection import yop_key
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+
+LEASE = 15 * 60  # Bu süreden uzun işlemde kalan iş sahibi çökmüş sayılıp tekrar verilir (saniye)
+MAX_ATTEMPTS = 3  # Bu kadar başarısız denemeden sonra iş "failed" durumunda bırakılır
+BUSY_TIMEOUT = 30  # Başka süreç yazarken veritabanı kilidi için beklenecek süre (saniye)
+
+
+class WorkQueue:
+    """
+    SQLite üzerinde kalıcı iş kuyruğu. Her iş bir anahtar (bölüm URL'i) ile tutulur ve
+    pending -> in_flight -> done / failed durumlarından geçer. İşler önceliğe göre dağıtılır;
+    `claim` tek bir yazma işleminde yapıldığından aynı iş iki tüketiciye (iş parçacığı ya da
+    süreç) verilmez. Süresi dolan (`lease`) işlemdeki işler tekrar dağıtılır.
+    """
+
+    def __init__(self, path, lease=LEASE, max_attempts=MAX_ATTEMPTS):
+        output_dir = os.path.dirname(path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        self.path = path
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "key TEXT PRIMARY KEY, state TEXT, priority INTEGER, meta TEXT, yops TEXT, "
+            "attempts INTEGER, owner TEXT, error TEXT, updated_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_order ON jobs (state, priority DESC)")
+
+    def add(self, key, priority=0, state=PENDING, yops=(), **meta):
+        """
+        İşi kuyruğa ekler. Var olan işin durumu değişmez, sadece bekleyen işin önceliği güncellenir.
+        `yops` işin daha önce çekildiği bilinen YÖP kodlarıdır (bkz. requeue). Yeni eklendiyse True döner.
+        """
+        yops = sorted({yop_key(yop) for yop in yops} - {""})
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?, 0, NULL, NULL, ?)",
+                (key, state, priority, json.dumps(meta, ensure_ascii=False), json.dumps(yops), time.time()),
+            )
+            if cursor.rowcount == 0:
+                self._db.execute("UPDATE jobs SET priority = ? WHERE key = ? AND state = ?", (priority, key, PENDING))
+                return False
+            return True
+
+    def claim(self, owner=None):
+        """
+        En yüksek öncelikli bekleyen işi (ya da süresi dolmuş işlemdeki işi) alır ve
+        (anahtar, meta) döndürür. Verilecek iş yoksa None.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "UPDATE jobs SET state = ?, owner = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE key = (SELECT key FROM jobs WHERE state = ? OR (state = ? AND updated_at < ?) "
+                "ORDER BY priority DESC, rowid LIMIT 1) RETURNING key, meta",
+                (IN_FLIGHT, owner, now, PENDING, IN_FLIGHT, now - self.lease),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def complete(self, key, yops=()):
+        """
+        İşi tamamlandı olarak işaretler ve içinden çıkan YÖP kodlarını saklar.
+        """
+        yops = sorted({yop_key(yop) for yop in yops} - {""})
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET state = ?, yops = ?, error = NULL, updated_at = ? WHERE key = ?",
+                (DONE, json.dumps(yops), time.time(), key),
+            )
+
+    def fail(self, key, error=None):
+        """
+        Başarısız işi deneme hakkı kaldıysa tekrar kuyruğa, kalmadıysa "failed" durumuna alır.
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET state = CASE WHEN attempts < ? THEN ? ELSE ? END, error = ?, updated_at = ? "
+                "WHERE key = ?",
+                (self.max_attempts, PENDING, FAILED, str(error) if error is not None else None, time.time(), key),
+            )
+
+    def requeue(self, keys=None, yops=None, states=(DONE, FAILED), before=None):
+        """
+        Verilen anahtarlardaki ya da `yops` kodlarından birini içeren işleri tekrar bekleyen
+        duruma alır ve deneme sayılarını sıfırlar. İkisi de verilmezse `states` durumundaki tüm
+        işler alınır. `before` verilirse sadece bu zamandan önce güncellenen işler alınır (örn.
+        değişiklik raporundan sonra zaten tekrar çekilenler atlanır). Tekrar kuyruğa alınan
+        anahtarları döndürür.
+        """
+        everything = keys is None and yops is None
+        keys = set(keys or ())
+        yops = {yop_key(yop) for yop in (yops or ())}
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT key, yops FROM jobs WHERE state IN ({', '.join('?' * len(states))}) AND updated_at < ?",
+                tuple(states) + (float("inf") if before is None else before,),
+            ).fetchall()
+            requeued = [
+                key for key, job_yops in rows
+                if everything or key in keys or yops.intersection(json.loads(job_yops))
+            ]
+            self._db.executemany(
+                "UPDATE jobs SET state = ?, attempts = 0, error = NULL, updated_at = ? WHERE key = ?",
+                [(PENDING, time.time(), key) for key in requeued],
+            )
+        return requeued
+
+    def release(self, owners):
+        """
+        Sahibi `owners` öneklerinden biriyle başlayan (örn. durdurulan sürecin "pid-") işlemdeki
+        işleri deneme sayılmadan bekleyen duruma alır. Serbest bırakılan iş sayısını döndürür.
+        """
+        released = 0
+        with self._lock:
+            for owner in owners:
+                released += self._db.execute(
+                    "UPDATE jobs SET state = ?, owner = NULL, attempts = MAX(attempts - 1, 0), updated_at = ? "
+                    "WHERE state = ? AND substr(owner, 1, ?) = ?",
+                    (PENDING, time.time(), IN_FLIGHT, len(owner), owner),
+                ).rowcount
+        return released
+
+    def state(self, key):
+        with self._lock:
+            row = self._db.execute("SELECT state FROM jobs WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def counts(self):
+        """
+        Durum başına iş sayılarını döndürür.
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        counts = {PENDING: 0, IN_FLIGHT: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def failures(self):
+        """
+        Deneme hakkı biten işlerin {anahtar: hata} eşleşmesini döndürür.
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT key, error FROM jobs WHERE state = ?", (FAILED,)).fetchall()
+        return dict(rows)
+
+    def reset(self):
+        """
+        Kuyruktaki tüm işleri siler.
+        """
+        with self._lock:
+            self._db.execute("DELETE FROM jobs")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def missing_net_yops(json_dir="json"):
+    """
+    `json/*.json` dosyalarında "Yerlesen_son_kisinin_netleri" alanı boş olan programların
+    YÖP kodlarını döndürür. Dosya yoksa boş küme.
+    """
+    missing = set()
+    for path in glob.glob(os.path.join(json_dir, "*.json")):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"{path} okunamadı: {e}")
+            continue
+        for universite in data.get("Universiteler", []):
+            for fakulte in universite.get("fakulteler", []):
+                for bolum in fakulte.get("bolumler", []):
+                    details = bolum.get("bolum_detaylari", {})
+                    if not details.get("Yerlesen_son_kisinin_netleri"):
+                        missing.add(yop_key(details.get("YOP_Kodu")))
+    missing.discard("")
+    return missing